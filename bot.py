@@ -7,8 +7,6 @@ import re
 import sys
 import time
 import traceback
-import json
-import sqlite3
 import pathlib
 
 from logging.handlers import TimedRotatingFileHandler
@@ -17,8 +15,11 @@ from dotenv import load_dotenv
 import discord
 from discord.ext import commands
 from utils.logging_helper import log_event
-
-import markovify
+from utils.storage import Storage
+from utils.markov_store import load_model
+from utils.message_pool import MessagePool
+from utils.model_registry import ModelRegistry
+from utils.sentence_service import SentenceService
 
 # -------------------- Konfiguration & Setup --------------------
 
@@ -62,13 +63,9 @@ logger = create_log_file(
 
 
 def json_model():
-    """Lädt das Markov-Modell aus einer JSON-Datei."""
-    with open(
-        os.path.join(globalPfad, "static/hivemind.json"), encoding="utf-8"
-    ) as json_file:
-        hivemind_json = json.load(json_file)
-    model = markovify.Text.from_json(hivemind_json)
-    print("hivemind.json loaded")
+    """Lädt das Markov-Modell (kompiliert, falls aktuell – sonst aus der JSON)."""
+    model = load_model(os.path.join(globalPfad, "static/hivemind.json"))
+    print(f"hivemind loaded ({model.__class__.__name__})")
     return model
 
 
@@ -81,18 +78,23 @@ class ZicklaaBotRewrite(commands.Bot):
             command_prefix=commands.when_mentioned_or("+"),  # Prefix = "+"
             intents=intents,
         )
-        self.db = sqlite3.connect(
-            os.path.join(globalPfad, "reminder-wishlist.db")
+        # Gemeinsamer, asynchroner DB-Zugriff für alle Cogs
+        self.db = Storage(os.path.join(globalPfad, "reminder-wishlist.db"))
+        # Aktuelles Hivemind-Modell, zur Laufzeit austauschbar (bot.models.reload())
+        self.models = ModelRegistry(json_model)
+        # Satz-Generierung off-loop mit Versuchs-/Zeitbudget (+ Satz-Pool)
+        self.sentences = SentenceService(
+            self.models,
+            pool_enabled=os.environ.get("HIVEMIND_POOL", "1") != "0",
         )
-        self.create_tables()
-        self.json_model = json_model()
+        # Geteilter Nachrichten-Cache/Fetch-Pool (Fav, Star, Quote, Discordle …)
+        self.message_pool = MessagePool(self)
 
-    def create_tables(self):
+    def create_tables(self, conn):
         """Erstellt notwendige Tabellen in der Datenbank, falls nicht vorhanden."""
         try:
-            cursor = self.db.cursor()
             # Reminders
-            cursor.execute(
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS reminders(
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -106,16 +108,16 @@ class ZicklaaBotRewrite(commands.Bot):
             )
             reminder_columns = [
                 x[1]
-                for x in cursor.execute(
+                for x in conn.execute(
                     "PRAGMA table_info(reminders)"
                 ).fetchall()
             ]
             if "parent_id" not in reminder_columns:
-                cursor.execute(
+                conn.execute(
                     "ALTER TABLE reminders ADD COLUMN parent_id INTEGER"
                 )
             # Wishlist
-            cursor.execute(
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS wishlist(
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -126,7 +128,7 @@ class ZicklaaBotRewrite(commands.Bot):
             """
             )
             # Favs
-            cursor.execute(
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS favs(
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -137,8 +139,31 @@ class ZicklaaBotRewrite(commands.Bot):
                 )
             """
             )
+            # Snapshot der Originalnachricht (für /allfavs ohne Einzel-Fetches)
+            fav_columns = [
+                x[1]
+                for x in conn.execute(
+                    "PRAGMA table_info(favs)"
+                ).fetchall()
+            ]
+            for column, decl in (
+                ("author", "TEXT"),
+                ("excerpt", "TEXT"),
+                ("attachment_url", "TEXT"),
+                ("jump_url", "TEXT"),
+                ("created_at", "REAL"),
+                ("snapshot_at", "REAL"),
+                ("gone", "INTEGER NOT NULL DEFAULT 0"),
+            ):
+                if column not in fav_columns:
+                    conn.execute(
+                        f"ALTER TABLE favs ADD COLUMN {column} {decl}"
+                    )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_favs_user_name ON favs(user_id, name COLLATE NOCASE)"
+            )
             # Stars
-            cursor.execute(
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS stars(
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -146,11 +171,57 @@ class ZicklaaBotRewrite(commands.Bot):
                 )
             """
             )
+            # Doppelte Sterne (Altlasten) entfernen, dann UNIQUE-Index
+            conn.execute(
+                """
+                DELETE FROM stars WHERE id NOT IN (
+                    SELECT MIN(id) FROM stars GROUP BY message_id
+                )
+            """
+            )
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_stars_message_id ON stars(message_id)"
+            )
+            # Star-Zähler für (auch ungecachte) Nachrichten
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS star_counts(
+                    message_id INTEGER PRIMARY KEY,
+                    channel_id INTEGER,
+                    count INTEGER NOT NULL DEFAULT 0
+                )
+            """
+            )
+            # Buli: Channels mit Live-Tor-Abo
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS buli_subscriptions(
+                    channel_id INTEGER PRIMARY KEY,
+                    user_id INTEGER
+                )
+            """
+            )
+            # Persistenter HTTP-Cache (football-data.org)
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache(
+                    key TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL,
+                    expires_at REAL,
+                    body TEXT
+                )
+            """
+            )
         except Exception as e:
             logging.error(f"Fehler beim Erstellen der Tabellen: {e}")
 
     async def setup_hook(self) -> None:
-        """Lädt alle Cogs und synchronisiert Slash-Commands."""
+        """Legt Tabellen an, lädt alle Cogs und synchronisiert Slash-Commands."""
+        await self.db.run(self.create_tables)
+        self.sentences.start()
+
         commands_dir = pathlib.Path(__file__).parent / "commands"
         for file in commands_dir.glob("*.py"):
             if file.name.startswith("_"):
@@ -183,6 +254,11 @@ class ZicklaaBotRewrite(commands.Bot):
             "slash_commands_cleared_global",
         )
 
+    async def close(self) -> None:
+        await super().close()
+        self.sentences.close()
+        await self.db.close()
+
 
 # -------------------- Bot-Instanz --------------------
 
@@ -200,8 +276,6 @@ async def on_ready():
         "Bot",
         "startup_complete",
     )
-    remindme = bot.get_cog("RemindMe")
-    await remindme.check_reminder()
 
 
 @bot.check
@@ -1,10 +1,17 @@
+import asyncio
+import json
 import logging
+import os
+import sys
+import time
 import discord
 from discord import app_commands
 from discord.ext import commands
 from pathlib import Path
 
+from utils.db_export import FORMATS, TABLES, default_filename, export_file, import_file
 from utils.logging_helper import log_event
+from utils.markov_build import keep_message, message_record
 
 logger = logging.getLogger("ZicklaaBotRewrite.Admin")
 
@@ -17,6 +24,25 @@ GUILD_IDS: tuple[int, ...] = (
     122739462210846721,
 )
 
+# Hivemind-Neubau: Quell-Channels & Dateien
+globalPfad = os.environ["globalPfad"]
+HIVEMIND_CHANNEL_IDS: tuple[int, ...] = (
+    122739462210846721,  # Hauptchannel
+)
+HIVEMIND_JSON = os.path.join(globalPfad, "static/hivemind.json")
+HIVEMIND_DUMP = os.path.join(globalPfad, "static/hivemind_dump.ndjson")
+# Arbeitsverzeichnis für ``python -m utils.markov_build``
+REPO_DIR = str(Path(__file__).resolve().parent.parent)
+
+# Export/Import der Bot-Tabellen
+BACKUP_DIR = os.path.join(globalPfad, "backups")
+# Cogs mit In-Memory-Spiegel einer Tabelle → nach Import neu laden
+TABLE_EXTENSIONS = {
+    "favs": "commands.fav",
+    "stars": "commands.star",
+    "reminders": "commands.remindme",
+}
+
 
 def _normalize_ext(name: str) -> str:
     """
@@ -48,6 +74,7 @@ def _available_extensions() -> list[str]:
 class Admin(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._hivemind_task: asyncio.Task | None = None
 
     # ---- Autocomplete-Helper ----
     async def _ext_autocomplete(
@@ -336,6 +363,413 @@ class Admin(commands.Cog):
                 exc_info=True,
             )
 
+    # ---------------- /hivemind_build ----------------
+    @app_commands.command(
+        name="hivemind_build",
+        description="Baut das Hivemind-Modell aus dem Chatverlauf neu (nur für Bot-Owner)."
+    )
+    @app_commands.describe(from_dump="Vorhandenen Dump nutzen statt den Verlauf neu zu laden")
+    async def hivemind_build(self, interaction: discord.Interaction, from_dump: bool = False):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("❌ Nicht erlaubt.", ephemeral=True)
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Unauthorized hivemind build",
+                interaction.user,
+                interaction.user.id,
+                command="/hivemind_build",
+            )
+            return
+
+        if self._hivemind_task and not self._hivemind_task.done():
+            await interaction.response.send_message("ℹ️ Es läuft bereits ein Build.", ephemeral=True)
+            return
+
+        await interaction.response.send_message("⏳ Hivemind-Build gestartet …", ephemeral=True)
+        self._hivemind_task = asyncio.create_task(
+            self._run_hivemind_build(interaction, from_dump))
+
+    # ---------------- /hivemind_reload ----------------
+    @app_commands.command(
+        name="hivemind_reload",
+        description="Lädt das Hivemind-Modell von der Platte neu (nur für Bot-Owner)."
+    )
+    async def hivemind_reload(self, interaction: discord.Interaction):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("❌ Nicht erlaubt.", ephemeral=True)
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Unauthorized hivemind reload",
+                interaction.user,
+                interaction.user.id,
+                command="/hivemind_reload",
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        started = time.monotonic()
+        try:
+            # Laden im Thread, Tausch atomar – Cogs merken nichts davon
+            await self.bot.models.reload()
+            duration = round(time.monotonic() - started, 1)
+            await interaction.followup.send(
+                f"✅ Hivemind neu geladen (Version {self.bot.models.version}, {duration}s).",
+                ephemeral=True,
+            )
+            log_event(
+                logger,
+                logging.INFO,
+                self.__class__.__name__,
+                "Hivemind reloaded",
+                interaction.user,
+                interaction.user.id,
+                command="/hivemind_reload",
+                version=self.bot.models.version,
+                duration_s=duration,
+            )
+        except Exception as e:
+            log_event(
+                logger,
+                logging.ERROR,
+                self.__class__.__name__,
+                "Hivemind reload failed",
+                interaction.user,
+                interaction.user.id,
+                command="/hivemind_reload",
+                error=e,
+                exc_info=True,
+            )
+            await interaction.followup.send("❌ Neu laden fehlgeschlagen.", ephemeral=True)
+
+    # ---------------- /message_pool_stats ----------------
+    @app_commands.command(
+        name="message_pool_stats",
+        description="Zeigt die Trefferquote des Nachrichten-Caches pro Cog (nur für Bot-Owner)."
+    )
+    async def message_pool_stats(self, interaction: discord.Interaction):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("❌ Nicht erlaubt.", ephemeral=True)
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Unauthorized message pool stats",
+                interaction.user,
+                interaction.user.id,
+                command="/message_pool_stats",
+            )
+            return
+
+        stats = self.bot.message_pool.stats()
+        cache = stats["cache"]
+        lines = [
+            f"**Cache:** {cache['entries']} Einträge, {cache['coalesced']} zusammengelegt, "
+            f"{cache['evictions']} verdrängt"
+        ]
+        for cog, s in stats["cogs"].items():
+            rate = "–" if s["hit_rate"] is None else f"{s['hit_rate']:.0%}"
+            lines.append(
+                f"**{cog}:** {rate} Treffer ({s.get('hits', 0)} Hits, "
+                f"{s.get('negative_hits', 0)} negativ, {s.get('coalesced', 0)} zusammengelegt, "
+                f"{s.get('misses', 0)} Misses, "
+                f"{s.get('refreshes', 0)} Refreshes, {s.get('history_calls', 0)} History)"
+            )
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    # ---------------- /hivemind_stats ----------------
+    @app_commands.command(
+        name="hivemind_stats",
+        description="Zeigt Trefferquote und Refill-Latenz des Satz-Pools (nur für Bot-Owner)."
+    )
+    async def hivemind_stats(self, interaction: discord.Interaction):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("❌ Nicht erlaubt.", ephemeral=True)
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Unauthorized hivemind stats",
+                interaction.user,
+                interaction.user.id,
+                command="/hivemind_stats",
+            )
+            return
+
+        sentences = self.bot.sentences
+        if not sentences.pool_enabled:
+            await interaction.response.send_message(
+                "ℹ️ Satz-Pool ist aus (`HIVEMIND_POOL=0`).", ephemeral=True)
+            return
+        stats = sentences.stats()
+        rate = "–" if stats["hit_rate"] is None else f"{stats['hit_rate']:.0%}"
+        refill = "–" if stats["refill_avg_ms"] is None else f"{stats['refill_avg_ms']} ms"
+        lines = [
+            f"**Pool:** {rate} Treffer ({stats['hits']} Hits, {stats['misses']} Misses)",
+            f"**Refill:** Ø {refill} pro Satz",
+        ]
+        for ratio, size in sorted(stats["pools"].items()):
+            lines.append(f"**overlap {ratio}:** {size}/{sentences.pool_size} Sätze")
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    # ---------------- /db_export ----------------
+    @app_commands.command(
+        name="db_export",
+        description="Exportiert eine Tabelle als NDJSON oder gzip-CSV (nur für Bot-Owner)."
+    )
+    @app_commands.describe(table="Tabelle", format="Dateiformat")
+    @app_commands.choices(
+        table=[app_commands.Choice(name=t, value=t) for t in TABLES],
+        format=[app_commands.Choice(name=f, value=f) for f in FORMATS],
+    )
+    async def db_export(self, interaction: discord.Interaction, table: str, format: str = "ndjson"):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("❌ Nicht erlaubt.", ephemeral=True)
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Unauthorized db export",
+                interaction.user,
+                interaction.user.id,
+                command="/db_export",
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        started = time.monotonic()
+        try:
+            os.makedirs(BACKUP_DIR, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(BACKUP_DIR, f"{stamp}-{default_filename(table, format)}")
+            # eigene Lese-Verbindung im Thread: blockiert weder Loop noch bot.db
+            count = await asyncio.to_thread(export_file, self.bot.db.path, table, path, format)
+            duration = round(time.monotonic() - started, 1)
+            text = f"✅ `{table}` exportiert: {count} Zeilen in {duration}s → `{path}`"
+            limit = getattr(interaction.guild, "filesize_limit", 10 * 1024 * 1024)
+            if os.path.getsize(path) <= limit:
+                await interaction.followup.send(text, file=discord.File(path), ephemeral=True)
+            else:
+                await interaction.followup.send(f"{text} (zu groß zum Anhängen)", ephemeral=True)
+            log_event(
+                logger,
+                logging.INFO,
+                self.__class__.__name__,
+                "DB exported",
+                interaction.user,
+                interaction.user.id,
+                command="/db_export",
+                table=table,
+                rows=count,
+                path=path,
+                duration_s=duration,
+            )
+        except Exception as e:
+            log_event(
+                logger,
+                logging.ERROR,
+                self.__class__.__name__,
+                "DB export failed",
+                interaction.user,
+                interaction.user.id,
+                command="/db_export",
+                table=table,
+                error=e,
+                exc_info=True,
+            )
+            await interaction.followup.send("❌ Export fehlgeschlagen.", ephemeral=True)
+
+    # ---------------- /db_import ----------------
+    @app_commands.command(
+        name="db_import",
+        description="Importiert eine Tabelle aus einem Export (nur für Bot-Owner)."
+    )
+    @app_commands.describe(
+        table="Tabelle",
+        datei="Datei im Backup-Ordner",
+        anhang="Alternativ: Exportdatei als Anhang",
+        replace="Vorhandene IDs überschreiben statt überspringen",
+    )
+    @app_commands.choices(table=[app_commands.Choice(name=t, value=t) for t in TABLES])
+    async def db_import(
+        self,
+        interaction: discord.Interaction,
+        table: str,
+        datei: str | None = None,
+        anhang: discord.Attachment | None = None,
+        replace: bool = False,
+    ):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("❌ Nicht erlaubt.", ephemeral=True)
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Unauthorized db import",
+                interaction.user,
+                interaction.user.id,
+                command="/db_import",
+            )
+            return
+        if (datei is None) == (anhang is None):
+            await interaction.response.send_message(
+                "❌ Bitte genau eins angeben: `datei` oder `anhang`.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        started = time.monotonic()
+        try:
+            os.makedirs(BACKUP_DIR, exist_ok=True)
+            if anhang is not None:
+                path = os.path.join(BACKUP_DIR, f"upload-{os.path.basename(anhang.filename)}")
+                await anhang.save(path)
+            else:
+                path = os.path.join(BACKUP_DIR, os.path.basename(datei))
+            # eigene Verbindung im Hilfs-Thread (eine Transaktion, alles oder
+            # nichts) – der Storage-Thread bleibt für die Cogs frei (WAL)
+            count = await asyncio.to_thread(import_file, self.bot.db.path, table, path, None, replace)
+            ext = TABLE_EXTENSIONS.get(table)
+            if ext in self.bot.extensions:
+                # Cogs bauen ihren Spiegel in cog_load neu auf (RemindMe startet
+                # dort auch den Scheduler wieder)
+                await self.bot.reload_extension(ext)
+            duration = round(time.monotonic() - started, 1)
+            await interaction.followup.send(
+                f"✅ `{table}` importiert: {count} Zeilen in {duration}s.", ephemeral=True)
+            log_event(
+                logger,
+                logging.INFO,
+                self.__class__.__name__,
+                "DB imported",
+                interaction.user,
+                interaction.user.id,
+                command="/db_import",
+                table=table,
+                rows=count,
+                path=path,
+                replace=replace,
+                duration_s=duration,
+            )
+        except Exception as e:
+            log_event(
+                logger,
+                logging.ERROR,
+                self.__class__.__name__,
+                "DB import failed",
+                interaction.user,
+                interaction.user.id,
+                command="/db_import",
+                table=table,
+                error=e,
+                exc_info=True,
+            )
+            await interaction.followup.send(f"❌ Import fehlgeschlagen: {e}", ephemeral=True)
+
+    @db_import.autocomplete("datei")
+    async def _backup_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        try:
+            names = sorted(os.listdir(BACKUP_DIR), reverse=True)
+        except OSError:
+            return []
+        current_lower = (current or "").lower()
+        return [
+            app_commands.Choice(name=n, value=n)
+            for n in names
+            if current_lower in n.lower() and not n.endswith(".tmp")
+        ][:25]
+
+    async def _record_history(self) -> int:
+        """Streamt den Verlauf der Quell-Channels in den NDJSON-Dump (atomar)."""
+        count = 0
+        tmp_path = f"{HIVEMIND_DUMP}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for cid in HIVEMIND_CHANNEL_IDS:
+                channel = self.bot.get_channel(cid) or await self.bot.fetch_channel(cid)
+                async for message in channel.history(limit=None, oldest_first=True):
+                    if message.author.bot or not keep_message(message.content):
+                        continue
+                    f.write(json.dumps(message_record(message), ensure_ascii=False) + "\n")
+                    count += 1
+        os.replace(tmp_path, HIVEMIND_DUMP)
+        return count
+
+    async def _run_hivemind_build(self, interaction: discord.Interaction, from_dump: bool):
+        started = time.monotonic()
+        try:
+            recorded = None if from_dump else await self._record_history()
+            # Eigener Prozess statt Pool im Bot: spawn-Worker importieren das
+            # Hauptmodul neu – im Bot wäre das bot.py samt Modell, DB & Logging
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "utils.markov_build", HIVEMIND_DUMP, "-o", HIVEMIND_JSON,
+                cwd=REPO_DIR,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate()
+            if proc.returncode != 0:
+                tail = stderr.decode(errors="replace").strip().splitlines()[-1:] or ["?"]
+                raise RuntimeError(f"markov_build exit {proc.returncode}: {tail[0]}")
+            summary = stdout.decode(errors="replace").strip().splitlines()[-1:] or [""]
+            # Frisch geschriebenes (kompaktes) Modell über die Registry live schalten
+            await self.bot.models.reload()
+        except Exception as e:
+            log_event(
+                logger,
+                logging.ERROR,
+                self.__class__.__name__,
+                "Hivemind build failed",
+                interaction.user,
+                interaction.user.id,
+                command="/hivemind_build",
+                error=e,
+                exc_info=True,
+            )
+            await self._notify_owner(interaction, f"❌ Hivemind-Build fehlgeschlagen: {e}")
+            return
+
+        duration = round(time.monotonic() - started, 1)
+        log_event(
+            logger,
+            logging.INFO,
+            self.__class__.__name__,
+            "Hivemind rebuilt",
+            interaction.user,
+            interaction.user.id,
+            command="/hivemind_build",
+            messages=recorded,
+            version=self.bot.models.version,
+            build=summary[0],
+            duration_s=duration,
+        )
+        await self._notify_owner(
+            interaction,
+            f"✅ Hivemind neu gebaut (Version {self.bot.models.version}, {duration}s).",
+        )
+
+    async def _notify_owner(self, interaction: discord.Interaction, text: str) -> None:
+        """Ergebnis langer Jobs per DM (Interaction-Token läuft nach 15 min ab), sonst in den Channel."""
+        try:
+            await interaction.user.send(text)
+            return
+        except discord.HTTPException:
+            pass
+        try:
+            await interaction.channel.send(f"{interaction.user.mention} {text}")
+        except Exception as e:
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Owner notification failed",
+                interaction.user,
+                interaction.user.id,
+                error=e,
+            )
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Admin(bot))
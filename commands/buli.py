@@ -1,27 +1,40 @@
 # buli_cog.py
 from collections import defaultdict
+import asyncio
 import logging
 import os
 import discord
 from datetime import datetime, timedelta, timezone
-import requests
+from typing import Iterable
 from zoneinfo import ZoneInfo
 from discord.ext import commands
 from discord import app_commands
 
+from utils.async_cache import AsyncCache
+from utils.football_data import FootballDataClient
 from utils.logging_helper import log_event
 
 logger = logging.getLogger("ZicklaaBotRewrite.Buli")
 
 BERLIN_TZ = ZoneInfo("Europe/Berlin")
 WEEKDAYS = ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
-BASE = "https://api.football-data.org/v4"
 COMP = "BL1"
-_SESSION: requests.Session | None = None
 
 LIVE_STATUSES = {"IN_PLAY", "PAUSED"}  # was als „live“ gilt
-REFRESH_COOLDOWN_SECONDS = 10  # ⏱️ Cooldown in Sekunden für Refresh
-TABLE_TTL_SECONDS = 180  # Cache-Lebensdauer der Tabelle
+UPCOMING_STATUSES = {"SCHEDULED", "TIMED"}
+
+# Hintergrund-Poller
+POLL_LIVE_SECONDS = 45  # solange ein Spiel läuft (oder gleich anfängt)
+POLL_IDLE_SECONDS = 3600  # sonst stündlich
+POLL_ERROR_SECONDS = 120  # nach einem fehlgeschlagenen Poll
+OFFSEASON_GAP = timedelta(days=7)  # längere Pause = Saison-/Winterpause
+OFFSEASON_WAKEUP = timedelta(days=1)  # so lange vor Wiederbeginn aufwachen
+
+RENDER_CACHE_ENTRIES = 64  # 34 Spieltage + Tabelle, Rest für alte Versionen
+
+# Tor-Benachrichtigungen
+GOAL_COALESCE_SECONDS = 20  # Änderungen so lange sammeln (Doppel-Tore, VAR)
+GOAL_MAX_GAP = timedelta(minutes=10)  # ältere Snapshots (z. B. nach Neustart) melden keine Tore
 
 
 '''# Emojis für alle Bundesliga-Vereine 2025/26
@@ -58,9 +71,6 @@ class MatchdayView(discord.ui.View):
         self.md_max = md_max
         self.current_md = current_md
         self._apply_disabled()
-        # Tabelle: Cache + Timestamp
-        self._table_embed: discord.Embed | None = None
-        self._table_cached_until: datetime | None = None
 
     def _apply_disabled(self):
         # Randbegrenzungen
@@ -76,12 +86,12 @@ class MatchdayView(discord.ui.View):
             return
         self.matchday -= 1
         self._apply_disabled()
-        await self.cog.update_embed(interaction, self.matchday, use_cache_only=True)
+        await self.cog.update_embed(interaction, self)
 
     @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.primary)
     async def refresh(self, interaction: discord.Interaction, button: discord.ui.Button):
         # Nur aktiv, wenn matchday == current_md (Button ist ansonsten disabled)
-        await self.cog.update_embed(interaction, self.matchday, refresh=True)
+        await self.cog.update_embed(interaction, self, refresh=True)
 
     @discord.ui.button(label="Nächster ➡️", style=discord.ButtonStyle.secondary)
     async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -90,58 +100,184 @@ class MatchdayView(discord.ui.View):
             return
         self.matchday += 1
         self._apply_disabled()
-        await self.cog.update_embed(interaction, self.matchday, use_cache_only=True)
+        await self.cog.update_embed(interaction, self)
 
-# -------------------- Cog --------------------
+# -------------------- Saison-Cache --------------------
 
 
-class Buli(commands.Cog):
+class SeasonCache:
     """
-    Bundesliga-Viewer mit Rate-Limit-freundlichem Cache:
-    - Erster Call lädt ALLE Spiele der Saison (1 API-Call).
-    - Navigation liest aus Cache.
-    - Refresh macht 1 Call NUR auf dem nächsten/aktuellen Spieltag (mit Cooldown).
+    Alle Spiele der Saison, gruppiert nach Spieltag.
+
+    ``apply`` vergleicht eine frische API-Antwort per Match-ID mit dem
+    Bestand und sortiert/formatiert nur die Spieltage neu, deren Spiele sich
+    geändert haben. ``full=False`` (z. B. nur der Live-Spieltag via
+    ``fetch_matchday``) entfernt keine Spiele, die in der Antwort fehlen.
     """
 
-    def __init__(self, bot):
-        self.bot = bot
-        self._md_min: int | None = None
-        self._md_max: int | None = None
+    def __init__(self):
+        self.by_id: dict[int, dict] = {}
+        self.matchdays: dict[int, list[dict]] = {}
+        self.date_ranges: dict[int, str] = {}
+        self.md_min: int | None = None
+        self.md_max: int | None = None
+        self.next_matchday: int | None = None
+        self.version = 0  # zählt jede Änderung am Bestand
+        self.md_versions: dict[int, int] = {}  # Spieltag -> version der letzten Änderung
+        self.updates: list[tuple[dict | None, dict]] = []  # (alt, neu) des letzten apply
+        self._md_ids: dict[int, set[int]] = defaultdict(set)
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.by_id)
+
+    @property
+    def matches(self):
+        return self.by_id.values()
+
+    def apply(self, matches: list[dict], *, full: bool = True) -> set[int]:
+        """Übernimmt ``matches`` und gibt die geänderten Spieltage zurück."""
+        changed: set[int] = set()
+        seen: set[int] = set()
+        self.updates = []
+
+        for m in matches:
+            mid, md = m.get("id"), m.get("matchday")
+            if mid is None or not isinstance(md, int):
+                continue
+            seen.add(mid)
+            old = self.by_id.get(mid)
+            if old == m:
+                continue
+            if old is not None and old.get("matchday") != md:
+                self._md_ids[old["matchday"]].discard(mid)
+                changed.add(old["matchday"])
+            self.by_id[mid] = m
+            self._md_ids[md].add(mid)
+            self.updates.append((old, m))
+            changed.add(md)
+
+        if full:
+            for mid in set(self.by_id) - seen:
+                md = self.by_id.pop(mid)["matchday"]
+                self._md_ids[md].discard(mid)
+                changed.add(md)
+
+        if not changed:
+            return changed
+
+        self.version += 1
+        for md in changed:
+            lst = sorted((self.by_id[i] for i in self._md_ids[md]),
+                         key=lambda x: to_dt(x["utcDate"]))
+            if lst:
+                self.matchdays[md] = lst
+                self.date_ranges[md] = format_date_range(lst)
+                self.md_versions[md] = self.version
+            else:
+                self.matchdays.pop(md, None)
+                self.date_ranges.pop(md, None)
+                self.md_versions.pop(md, None)
+                self._md_ids.pop(md, None)
+
+        mds = self.matchdays.keys()
+        self.md_min, self.md_max = (min(mds), max(mds)) if mds else (1, 34)
+        self.next_matchday = determine_next_matchday_from_all(list(self.by_id.values()))
+        return changed
+
+    def active_matchdays(self, now: datetime) -> set[int]:
+        """Spieltage mit laufenden oder überfälligen (Anstoß vorbei, noch TIMED) Spielen."""
+        return {
+            m["matchday"] for m in self.by_id.values()
+            if m.get("status") in LIVE_STATUSES
+            or (m.get("status") in UPCOMING_STATUSES and to_dt(m["utcDate"]) <= now)
+        }
+
+# -------------------- Cog --------------------
 
-        # Cache: matchday -> [matches...], sowie vorberechnete Date-Ranges
-        self._md_cache: dict[int, list[dict]] = {}
-        self._md_date_range: dict[int, str] = {}
-        self._cache_ready: bool = False
 
-        # Merker: Welcher Spieltag ist „next/aktuell“ laut Cache?
-        self._next_matchday: int | None = None
+class Buli(commands.Cog):
+    """
+    Bundesliga-Viewer mit gemeinsamem Snapshot:
+    - Ein Hintergrund-Poller aktualisiert den Saison-Cache (1 API-Call) –
+      alle 30–60 s, solange ein Spiel läuft (dann nur dieser Spieltag),
+      sonst stündlich; außerhalb der Saison pausiert er.
+    - Commands und Buttons lesen nur den Snapshot, API-Last ist also
+      unabhängig von der Anzahl der Nutzer.
+    """
 
-        # Cooldown-Tracker pro Spieltag
-        self._refresh_cooldown_until: dict[int, datetime] = {}
+    def __init__(self, bot, db):
+        self.bot = bot
+        self.db = db
+
+        # Saison-Cache (inkrementell) & Snapshot-Stand
+        self.season = SeasonCache()
+        self._snapshot_at: datetime | None = None
+        self._full_refresh_at: datetime | None = None
+        self._from_disk = False  # Snapshot stammt aus dem DB-Cache, noch nicht revalidiert
+        self._snapshot_lock = asyncio.Lock()
+
+        # Tabelle (vom Poller mitgepflegt), Version zählt echte Änderungen
+        self._standings_table: list[dict] | None = None
+        self._standings_version = 0
+
+        # Render-Cache: ("md", Spieltag, md_version) / ("table", version) -> Embed;
+        # veraltete Versionen fallen per LRU heraus
+        self._renders = AsyncCache(ttl=None, max_entries=RENDER_CACHE_ENTRIES)
+
+        # football-data.org (async, gepoolt; wird beim ersten Zugriff erstellt)
+        self.client: FootballDataClient | None = None
+        self._poll_task: asyncio.Task | None = None
+
+        # Tor-Abos: Channel-IDs + gesammelte Änderungen (match_id -> (Stand vorher, Match))
+        self.subscribers: set[int] = set()
+        self._pending_goals: dict[int, tuple[tuple[int, int], dict]] = {}
+        self._goal_task: asyncio.Task | None = None
+
+    async def cog_load(self):
+        rows = await self.db.fetchall("SELECT channel_id FROM buli_subscriptions")
+        self.subscribers = {row[0] for row in rows}
+        await self._warm_from_disk()
+        self.start_poller()
+
+    async def cog_unload(self):
+        for task in (self._poll_task, self._goal_task):
+            if task is not None:
+                task.cancel()
+        self._poll_task = self._goal_task = None
+        if self.client is not None:
+            await self.client.close()
+
+    def get_client(self) -> FootballDataClient:
+        """Gemeinsamer API-Client des Cogs (Token aus der .env)."""
+        api_token = os.environ["FOOTBALL_DATA_API_TOKEN"]
+        if not api_token:
+            raise RuntimeError("FOOTBALL_DATA_API_TOKEN nicht gesetzt.")
+        if self.client is None:
+            self.client = FootballDataClient(api_token, db=self.db)
+        return self.client
 
     @app_commands.command(name="buli", description="Zeigt den nächsten Bundesliga-Spieltag an")
     async def buli(self, interaction: discord.Interaction):
-        """Slash-Command: Zeigt den nächsten Spieltag mit Navigation & Live-Refresh (nur auf aktuellem Spieltag)."""
+        """Slash-Command: Zeigt den nächsten Spieltag mit Navigation & Refresh aus dem Snapshot."""
         try:
-            api_token = os.environ["FOOTBALL_DATA_API_TOKEN"]
-            if not api_token:
-                raise RuntimeError("FOOTBALL_DATA_API_TOKEN nicht gesetzt.")
-
-            session = get_session(api_token)
-
-            # 1) IMMER frische Daten holen (1 API-Call) und Cache damit überschreiben
-            await self._refresh_full_cache(session)
+            if not self.snapshot_fresh():
+                # kalter Cache → API-Call, evtl. länger als Discords 3 s
+                await interaction.response.defer()
+            await self._ensure_snapshot()
 
-            md_min, md_max = self._md_min or 1, self._md_max or 34
-            start_md = self._next_matchday or md_min
+            season = self.season
+            md_min, md_max = season.md_min or 1, season.md_max or 34
+            start_md = season.next_matchday or md_min
 
-            fixtures = self._md_cache[start_md]
-            date_range = self._md_date_range[start_md]
-            embed = build_embed(start_md, fixtures, date_range)
+            embed = self.matchday_embed(start_md)
             view = MatchdayView(self, start_md, md_min,
                                 md_max, current_md=start_md)
 
-            await interaction.response.send_message(embed=embed, view=view)
+            if interaction.response.is_done():
+                await interaction.followup.send(embed=embed, view=view)
+            else:
+                await interaction.response.send_message(embed=embed, view=view)
             log_event(
                 logger,
                 logging.INFO,
@@ -151,10 +287,14 @@ class Buli(commands.Cog):
                 interaction.user.id,
                 command="/buli",
                 matchday=start_md,
+                snapshot_at=self._snapshot_at,
             )
 
         except Exception as e:
-            await interaction.response.send_message("❌ Klappt nit lol 🤷", ephemeral=True)
+            if interaction.response.is_done():
+                await interaction.followup.send("❌ Klappt nit lol 🤷", ephemeral=True)
+            else:
+                await interaction.response.send_message("❌ Klappt nit lol 🤷", ephemeral=True)
             log_event(
                 logger,
                 logging.ERROR,
@@ -168,70 +308,28 @@ class Buli(commands.Cog):
             )
 
     @app_commands.command(name="tabelle", description="Zeigt die aktuelle Bundesliga-Tabelle (mit Cache & hübscher Formatierung).")
-    @app_commands.describe(refresh="Ignoriere Cache und lade neu (kann Rate Limit belasten).")
-    async def tabelle(self, interaction: discord.Interaction, refresh: bool = False):
+    async def tabelle(self, interaction: discord.Interaction):
+        await interaction.response.defer()
         try:
-            api_token = os.environ["FOOTBALL_DATA_API_TOKEN"]
-            if not api_token:
-                raise RuntimeError("FOOTBALL_DATA_API_TOKEN nicht gesetzt.")
-            session = get_session(api_token)
-
-            now = datetime.now(timezone.utc)
-
-            use_cache = (
-                not refresh
-                and self._table_embed is not None
-                and self._table_cached_until is not None
-                and now < self._table_cached_until
-            )
-
-            if use_cache:
-                await interaction.response.send_message(embed=self._table_embed)
-                log_event(
-                    logger,
-                    logging.INFO,
-                    self.__class__.__name__,
-                    "Table from cache",
-                    interaction.user,
-                    interaction.user.id,
-                    command="/tabelle",
-                    cache_until=self._table_cached_until,
-                )
-                return
-
-            # „Frisch“ laden
-            await interaction.response.defer(thinking=True, ephemeral=False)
-            data = fd_get_standings(session)
-            standings = data.get("standings", [])
-            total = next(
-                (s for s in standings if s.get("type") == "TOTAL"), None)
-            if not total:
+            await self._ensure_snapshot()
+            embed = self.table_embed()
+            if embed is None:
                 raise RuntimeError("Standings (TOTAL) nicht gefunden.")
 
-            embed = build_table_embed(total)
-
-            # Cache aktualisieren
-            self._table_embed = embed
-            self._table_cached_until = now + \
-                timedelta(seconds=TABLE_TTL_SECONDS)
-
             await interaction.followup.send(embed=embed)
             log_event(
                 logger,
                 logging.INFO,
                 self.__class__.__name__,
-                "Table refreshed",
+                "Table from snapshot",
                 interaction.user,
                 interaction.user.id,
                 command="/tabelle",
-                cache_until=self._table_cached_until,
+                snapshot_at=self._snapshot_at,
             )
 
         except Exception as e:
-            if interaction.response.is_done():
-                await interaction.followup.send("❌ Tabelle derzeit nicht verfügbar.", ephemeral=True)
-            else:
-                await interaction.response.send_message("❌ Tabelle derzeit nicht verfügbar.", ephemeral=True)
+            await interaction.followup.send("❌ Tabelle derzeit nicht verfügbar.", ephemeral=True)
             log_event(
                 logger,
                 logging.ERROR,
@@ -244,119 +342,90 @@ class Buli(commands.Cog):
                 exc_info=True,
             )
 
-    async def update_embed(
-        self,
-        interaction: discord.Interaction,
-        matchday: int,
-        *,
-        refresh: bool = False,
-        use_cache_only: bool = False,
-    ):
-        """
-        Aktualisiert das Embed:
-        - use_cache_only=True: kein API-Call, nur Cache.
-        - refresh=True: wenn matchday == _next_matchday -> 1 API-Call (mit Cooldown),
-                        sonst Cache.
-        """
-        try:
-            api_token = os.environ["FOOTBALL_DATA_API_TOKEN"]
-            session = get_session(api_token)
-
-            # Safety: Cache da?
-            if not self._cache_ready:
-                await self._ensure_cache(session)
-
-            # Clamp sicherheitshalber
-            md_min, md_max = self._md_min or 1, self._md_max or 34
-            matchday = max(md_min, min(md_max, matchday))
-            current_md = self._next_matchday or md_min
+    @app_commands.command(name="buli_subscribe", description="Postet Live-Tore der Bundesliga automatisch in diesen Channel")
+    async def buli_subscribe(self, interaction: discord.Interaction):
+        channel_id = interaction.channel_id
+        if channel_id in self.subscribers:
+            await interaction.response.send_message("ℹ️ Dieser Channel hat die Tore schon abonniert.", ephemeral=True)
+            return
+        await self.db.execute(
+            "INSERT OR IGNORE INTO buli_subscriptions(channel_id, user_id) VALUES (?, ?)",
+            (channel_id, interaction.user.id),
+        )
+        self.subscribers.add(channel_id)
+        self.start_poller()
+        await interaction.response.send_message("⚽ Live-Tore kommen ab jetzt in diesen Channel.")
+        log_event(
+            logger,
+            logging.INFO,
+            self.__class__.__name__,
+            "Channel subscribed",
+            interaction.user,
+            interaction.user.id,
+            command="/buli_subscribe",
+            channel=channel_id,
+        )
 
-            if use_cache_only:
-                fixtures = self._md_cache.get(matchday) or []
-                date_range = self._md_date_range.get(matchday, "")
-            else:
-                # Refresh-Strategie (nur auf aktuellem Spieltag + Cooldown)
-                if refresh and self._next_matchday is not None and matchday == self._next_matchday:
-                    now = datetime.now(timezone.utc)
-                    until = self._refresh_cooldown_until.get(matchday)
-                    if until and now < until:
-                        # Cooldown aktiv → ephemere Info, kein API-Call
-                        seconds = int((until - now).total_seconds())
-                        await interaction.response.send_message(
-                            f"⏳ Bitte warte noch **{seconds}s**, bevor du erneut refreshst.",
-                            ephemeral=True,
-                        )
-                        log_event(
-                            logger,
-                            logging.INFO,
-                            self.__class__.__name__,
-                            "Refresh cooldown",
-                            interaction.user,
-                            interaction.user.id,
-                            command="/buli", matchday=matchday, seconds=seconds,
-                        )
-                        return
-
-                    # Erlaubt → 1 API-Call + Cooldown setzen
-                    fixtures, date_range = fetch_matchday(session, matchday)
-                    self._md_cache[matchday] = fixtures
-                    self._md_date_range[matchday] = date_range
-                    self._refresh_cooldown_until[matchday] = now + \
-                        timedelta(seconds=REFRESH_COOLDOWN_SECONDS)
-                    log_event(
-                        logger,
-                        logging.INFO,
-                        self.__class__.__name__,
-                        "Refresh performed",
-                        interaction.user,
-                        interaction.user.id,
-                        command="/buli",
-                        matchday=matchday,
-                        next_refresh=self._refresh_cooldown_until[matchday].isoformat(
-                        ),
-                    )
-                else:
-                    # Kein Refresh oder nicht aktueller Spieltag → Cache nutzen
-                    fixtures = self._md_cache.get(matchday) or []
-                    date_range = self._md_date_range.get(matchday, "")
-
-            # Falls aus irgendeinem Grund leer (sollte nicht passieren), fallback einmalig:
-            if not (fixtures and date_range):
-                fixtures, date_range = fetch_matchday(session, matchday)
-                self._md_cache[matchday] = fixtures
-                self._md_date_range[matchday] = date_range
-                log_event(
-                    logger,
-                    logging.INFO,
-                    self.__class__.__name__,
-                    "Fallback fetch",
-                    interaction.user,
-                    interaction.user.id,
-                    command="/buli",
-                    matchday=matchday,
-                )
+    @app_commands.command(name="buli_unsubscribe", description="Beendet die Live-Tor-Benachrichtigungen in diesem Channel")
+    async def buli_unsubscribe(self, interaction: discord.Interaction):
+        channel_id = interaction.channel_id
+        if channel_id not in self.subscribers:
+            await interaction.response.send_message("ℹ️ Dieser Channel hat keine Tore abonniert.", ephemeral=True)
+            return
+        await self.unsubscribe(channel_id)
+        await interaction.response.send_message("🔕 Keine Live-Tore mehr in diesem Channel.")
+        log_event(
+            logger,
+            logging.INFO,
+            self.__class__.__name__,
+            "Channel unsubscribed",
+            interaction.user,
+            interaction.user.id,
+            command="/buli_unsubscribe",
+            channel=channel_id,
+        )
 
-            embed = build_embed(matchday, fixtures, date_range)
-            view = MatchdayView(self, matchday, md_min,
-                                md_max, current_md=current_md)
+    async def unsubscribe(self, channel_id: int):
+        self.subscribers.discard(channel_id)
+        await self.db.execute(
+            "DELETE FROM buli_subscriptions WHERE channel_id = ?", (channel_id,))
 
-            # Wenn wir oben bereits geantwortet haben (Cooldown-Hinweis), NICHT nochmal antworten
+    async def update_embed(self, interaction: discord.Interaction, view: MatchdayView, *, refresh: bool = False):
+        """
+        Zeigt ``view.matchday`` aus dem Render-Cache an (kein API-Call) und
+        editiert die Nachricht mit derselben View. ``refresh`` kennzeichnet
+        nur den Refresh-Button fürs Logging – der Snapshot ist immer so
+        aktuell, wie der Poller ihn hält.
+        """
+        try:
+            if not self.snapshot_fresh():
+                await interaction.response.defer()
+            await self._ensure_snapshot()
+
+            # Clamp sicherheitshalber; Grenzen/aktueller Spieltag können sich
+            # seit dem Öffnen der View verschoben haben
+            season = self.season
+            view.md_min, view.md_max = season.md_min or 1, season.md_max or 34
+            view.matchday = matchday = max(view.md_min, min(view.md_max, view.matchday))
+            view.current_md = season.next_matchday or view.md_min
+            view._apply_disabled()
+
+            embed = self.matchday_embed(matchday)
             if interaction.response.is_done():
-                await interaction.followup.edit_message(message_id=interaction.message.id, embed=embed, view=view)
+                await interaction.edit_original_response(embed=embed, view=view)
             else:
                 await interaction.response.edit_message(embed=embed, view=view)
 
-            action = "Refresh (live)" if (refresh and matchday == self._next_matchday) else (
-                "Navigation (Cache)" if use_cache_only else "Update")
             log_event(
                 logger,
                 logging.INFO,
                 self.__class__.__name__,
-                action,
+                "Refresh (Snapshot)" if refresh else "Navigation (Snapshot)",
                 interaction.user,
                 interaction.user.id,
                 command="/buli",
                 matchday=matchday,
+                snapshot_at=self._snapshot_at,
             )
 
         except Exception as e:
@@ -376,80 +445,245 @@ class Buli(commands.Cog):
                 exc_info=True,
             )
 
-    # -------------------- Cache/Init --------------------
-
-    async def _refresh_full_cache(self, session: requests.Session):
-        """Lädt ALLE Spiele der Saison neu und überschreibt den Cache (immer 1 API-Call)."""
-        data = fd_get(session, f"/competitions/{COMP}/matches", params=None)
-        matches = data.get("matches", [])
-        if not matches:
-            raise RuntimeError("Keine Spiele für laufende Saison gefunden.")
-
-        # md_min/md_max
-        mds = [m.get("matchday")
-               for m in matches if isinstance(m.get("matchday"), int)]
-        self._md_min, self._md_max = (min(mds), max(mds)) if mds else (1, 34)
-
-        # matchday -> list[matches], sortiert
-        grouped: dict[int, list[dict]] = defaultdict(list)
-        for m in matches:
-            md = m.get("matchday")
-            if isinstance(md, int):
-                grouped[md].append(m)
-
-        self._md_cache.clear()
-        self._md_date_range.clear()
-        for md, lst in grouped.items():
-            lst.sort(key=lambda x: to_dt(x["utcDate"]))
-            self._md_cache[md] = lst
-            self._md_date_range[md] = format_date_range(lst) if lst else ""
-
-        # „nächsten/aktuellen“ Spieltag bestimmen
-        self._next_matchday = determine_next_matchday_from_all(matches)
-        self._cache_ready = True
-
-    async def _ensure_cache(self, session: requests.Session):
-        """Lädt einmalig alle Spiele der Saison und füllt den Matchday-Cache (1 API-Call)."""
-        if self._cache_ready:
+    # -------------------- Render-Cache --------------------
+
+    def matchday_embed(self, matchday: int) -> discord.Embed:
+        """Embed eines Spieltags; neu gebaut nur, wenn sich der Spieltag geändert hat."""
+        key = ("md", matchday, self.season.md_versions.get(matchday, 0))
+        embed = self._renders.get(key)
+        if embed is None:
+            embed = build_embed(
+                matchday,
+                self.season.matchdays.get(matchday) or [],
+                self.season.date_ranges.get(matchday, ""),
+            )
+            self._renders.set(key, embed)
+        return embed
+
+    def table_embed(self) -> discord.Embed | None:
+        """Tabellen-Embed; neu gebaut nur nach einer echten Tabellenänderung."""
+        if self._standings_table is None:
+            return None
+        key = ("table", self._standings_version)
+        embed = self._renders.get(key)
+        if embed is None:
+            embed = build_table_embed({"table": self._standings_table})
+            self._renders.set(key, embed)
+        return embed
+
+    # -------------------- Tor-Benachrichtigungen --------------------
+
+    def queue_goals(self, changes: list[tuple[dict, dict]]) -> None:
+        """
+        Sammelt Spielstandsänderungen GOAL_COALESCE_SECONDS lang pro Spiel;
+        danach geht eine Nachricht pro Channel raus. Wird ein Tor in der
+        Zeit zurückgenommen (VAR), fällt die Meldung weg.
+        """
+        if not changes or not self.subscribers:
             return
+        for old, new in changes:
+            before = self._pending_goals.get(new["id"], (goals(old),))[0]
+            self._pending_goals[new["id"]] = (before, new)
+        if self._goal_task is None or self._goal_task.done():
+            self._goal_task = asyncio.create_task(self._flush_goals())
+
+    async def _flush_goals(self):
+        # Schleife statt einmaligem Lauf: Änderungen, die während des Sendens
+        # eintreffen, sehen einen laufenden Task und planen keinen neuen ein
+        while self._pending_goals:
+            await asyncio.sleep(GOAL_COALESCE_SECONDS)
+            pending, self._pending_goals = self._pending_goals, {}
+            lines = [
+                goal_line(match)
+                for before, match in pending.values()
+                if goals(match) != before
+            ]
+            if not lines:
+                continue
+            content = "⚽ **Tor!**\n" + "\n".join(lines)
+            channel_ids = list(self.subscribers)
+            results = await asyncio.gather(
+                *(self._send_goal(cid, content) for cid in channel_ids),
+                return_exceptions=True,
+            )
+            log_event(
+                logger,
+                logging.INFO,
+                self.__class__.__name__,
+                "Goal notifications sent",
+                matches=len(lines),
+                channels=len(channel_ids),
+                failed=sum(1 for r in results if isinstance(r, Exception)),
+            )
 
-        # 1 API-Call
-        data = fd_get(session, f"/competitions/{COMP}/matches", params=None)
-        matches = data.get("matches", [])
-        if not matches:
-            raise RuntimeError("Keine Spiele für laufende Saison gefunden.")
-
-        # md_min/md_max
-        mds = [m.get("matchday")
-               for m in matches if isinstance(m.get("matchday"), int)]
-        self._md_min, self._md_max = (min(mds), max(mds)) if mds else (1, 34)
-
-        # matchday -> list[matches], sortiert
-        grouped: dict[int, list[dict]] = defaultdict(list)
-        for m in matches:
-            md = m.get("matchday")
-            if isinstance(md, int):
-                grouped[md].append(m)
-
-        for md, lst in grouped.items():
-            lst.sort(key=lambda m: to_dt(m["utcDate"]))
-            self._md_cache[md] = lst
-            self._md_date_range[md] = format_date_range(lst) if lst else ""
+    async def _send_goal(self, channel_id: int, content: str):
+        try:
+            channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+            await channel.send(content)
+        except (discord.NotFound, discord.Forbidden):
+            # Channel weg oder keine Rechte mehr → Abo aufräumen
+            await self.unsubscribe(channel_id)
+            raise
+
+    # -------------------- Snapshot & Poller --------------------
+
+    def start_poller(self) -> None:
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    def snapshot_fresh(self) -> bool:
+        """True, wenn der Snapshot ohne API-Call (und ohne Lock) nutzbar ist."""
+        if not self.season.ready or self._snapshot_at is None:
+            return False
+        poller_running = self._poll_task is not None and not self._poll_task.done()
+        age = (datetime.now(timezone.utc) - self._snapshot_at).total_seconds()
+        return poller_running or age < POLL_IDLE_SECONDS
+
+    async def _ensure_snapshot(self):
+        """
+        Sorgt für einen nutzbaren Snapshot. Läuft der Poller, ist das nur beim
+        allerersten Aufruf ein API-Call; pausiert er (Saisonpause), wird ein
+        Snapshot älter als POLL_IDLE_SECONDS einmalig erneuert. Der Lock wird
+        nur bei kaltem Cache genommen – ein laufender Poll blockiert warme
+        Aufrufe also nicht; gleichzeitige kalte Aufrufe teilen sich einen Call.
+        """
+        if self.snapshot_fresh():
+            return
+        async with self._snapshot_lock:
+            if not self.snapshot_fresh():
+                await self._refresh_snapshot()
+        self.start_poller()
 
-        # „nächsten/aktuellen“ Spieltag bestimmen
-        self._next_matchday = determine_next_matchday_from_all(matches)
-        self._cache_ready = True
+    async def _warm_from_disk(self):
+        """
+        Füllt Saison-Cache & Tabelle aus den zuletzt gespeicherten
+        API-Antworten – der erste /buli nach einem Neustart braucht so keinen
+        API-Call. Der Poller revalidiert direkt danach im Hintergrund.
+        """
+        try:
+            client = self.get_client()
+            cached = await client.cached(f"/competitions/{COMP}/matches")
+            if cached is None:
+                return
+            data, fetched_at = cached
+            self.season.apply(data.get("matches", []))
+            standings = await client.cached(f"/competitions/{COMP}/standings")
+            if standings is not None:
+                self._apply_standings(standings[0])
+        except Exception as e:
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Warm start failed",
+                error=e,
+            )
+            return
 
+        self._snapshot_at = self._full_refresh_at = datetime.fromtimestamp(fetched_at, timezone.utc)
+        self._from_disk = self.season.ready
         log_event(
             logger,
             logging.INFO,
             self.__class__.__name__,
-            "Cache built",
-            matchdays=len(self._md_cache),
-            bounds=f"{self._md_min}-{self._md_max}",
-            next_matchday=self._next_matchday,
+            "Warm start from disk",
+            matchdays=len(self.season.matchdays),
+            snapshot_at=self._snapshot_at,
         )
 
+    def _apply_standings(self, data: dict):
+        total = next(
+            (s for s in data.get("standings", []) if s.get("type") == "TOTAL"), None)
+        if total and total.get("table") != self._standings_table:
+            self._standings_table = total.get("table") or []
+            self._standings_version += 1
+
+    async def _refresh_snapshot(self):
+        """
+        Aktualisiert den Saison-Cache und – nur bei Änderungen – die Tabelle.
+        Während genau ein Spieltag läuft, reicht ``fetch_matchday``; sonst
+        (und mindestens stündlich) kommt die ganze Saison.
+        """
+        client = self.get_client()
+        now = datetime.now(timezone.utc)
+        active = self.season.active_matchdays(now) if self.season.ready else set()
+        full = (
+            len(active) != 1
+            or self._full_refresh_at is None
+            or (now - self._full_refresh_at).total_seconds() >= POLL_IDLE_SECONDS
+        )
+
+        if full:
+            data = await client.get(f"/competitions/{COMP}/matches")
+            matches = data.get("matches", [])
+            if not matches:
+                raise RuntimeError("Keine Spiele für laufende Saison gefunden.")
+            changed = self.season.apply(matches)
+            self._full_refresh_at = now
+        else:
+            matches, _ = await fetch_matchday(client, next(iter(active)))
+            changed = self.season.apply(matches, full=False)
+
+        if changed or self._standings_table is None or self._from_disk:
+            self._apply_standings(await fd_get_standings(client))
+
+        # Tore nur aus lückenlos aufeinanderfolgenden Snapshots melden
+        if self._snapshot_at is not None and now - self._snapshot_at <= GOAL_MAX_GAP:
+            self.queue_goals(score_changes(self.season.updates))
+        self._snapshot_at = now
+        self._from_disk = False
+
+        if changed:
+            log_event(
+                logger,
+                logging.INFO,
+                self.__class__.__name__,
+                "Season cache updated",
+                full=full,
+                matchdays=sorted(changed),
+                version=self.season.version,
+                next_matchday=self.season.next_matchday,
+            )
+
+    async def _poll_loop(self):
+        while True:
+            # Ohne (oder nur mit Disk-)Snapshot sofort laden, sonst Takt nach Spiellage
+            if self.season.ready and not self._from_disk:
+                delay = next_poll_delay(self.season.matches, datetime.now(timezone.utc))
+                if delay is None:
+                    log_event(
+                        logger,
+                        logging.INFO,
+                        self.__class__.__name__,
+                        "Poller stopped (season over)",
+                    )
+                    return
+                log_event(
+                    logger,
+                    logging.DEBUG,
+                    self.__class__.__name__,
+                    "Poll scheduled",
+                    delay_s=round(delay),
+                    next_matchday=self.season.next_matchday,
+                )
+                await asyncio.sleep(delay)
+
+            try:
+                async with self._snapshot_lock:
+                    await self._refresh_snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_event(
+                    logger,
+                    logging.ERROR,
+                    self.__class__.__name__,
+                    "Poll failed",
+                    error=e,
+                    exc_info=True,
+                )
+                await asyncio.sleep(POLL_ERROR_SECONDS)
+
 # -------------------- Gruppierung & Embed --------------------
 
 
@@ -510,27 +744,6 @@ def build_embed(matchday: int, fixtures: list[dict], date_range: str) -> discord
 # -------------------- API & Hilfsfunktionen --------------------
 
 
-def get_session(api_token: str) -> requests.Session:
-    global _SESSION
-    if _SESSION is None:
-        s = requests.Session()
-        s.headers.update({"X-Auth-Token": api_token})
-        _SESSION = s
-    else:
-        _SESSION.headers.update({"X-Auth-Token": api_token})
-    return _SESSION
-
-
-def fd_get(session: requests.Session, path: str, params: dict | None = None) -> dict:
-    url = f"{BASE}{path}"
-    resp = session.get(url, params=params, timeout=15)
-    if resp.status_code == 429:
-        raise RuntimeError("Rate Limit erreicht (HTTP 429).")
-    if not resp.ok:
-        raise RuntimeError(f"API Fehler {resp.status_code}: {resp.text}")
-    return resp.json()
-
-
 def to_dt(utc_iso: str) -> datetime:
     return datetime.fromisoformat(utc_iso.replace("Z", "+00:00"))
 
@@ -539,8 +752,10 @@ def team_name(team: dict) -> str:
     return team.get("shortName") or team.get("tla") or team.get("name") or "?"
 
 
-def score_str(match: dict) -> str:
-    status = match.get("status")
+def current_score(match: dict | None) -> tuple[int, int] | None:
+    """(Heim, Gast) aus dem ersten vollständigen Score-Block, sonst None."""
+    if match is None:
+        return None
     s = match.get("score") or {}
     candidates = [
         s.get("fullTime") or {},
@@ -548,12 +763,17 @@ def score_str(match: dict) -> str:
         s.get("extraTime") or {},
         s.get("halfTime") or {},
     ]
-    home = away = None
     for c in candidates:
         h, a = c.get("home"), c.get("away")
         if h is not None and a is not None:
-            home, away = h, a
-            break
+            return h, a
+    return None
+
+
+def score_str(match: dict) -> str:
+    status = match.get("status")
+    s = match.get("score") or {}
+    home, away = current_score(match) or (None, None)
 
     pen = s.get("penalties") or {}
     pen_home, pen_away = pen.get("home"), pen.get("away")
@@ -573,11 +793,12 @@ def score_str(match: dict) -> str:
     return ""
 
 
-def fetch_matchday(session: requests.Session, matchday: int) -> tuple[list[dict], str]:
-    matches = fd_get(
-        session, f"/competitions/{COMP}/matches",
+async def fetch_matchday(client: FootballDataClient, matchday: int) -> tuple[list[dict], str]:
+    data = await client.get(
+        f"/competitions/{COMP}/matches",
         params={"matchday": matchday}
-    ).get("matches", [])
+    )
+    matches = data.get("matches", [])
 
     if not matches:
         raise RuntimeError(f"Keine Spiele für Spieltag {matchday} gefunden.")
@@ -618,6 +839,55 @@ def determine_next_matchday_from_all(all_matches: list[dict]) -> int | None:
     return None
 
 
+def score_changes(updates: Iterable[tuple[dict | None, dict]]) -> list[tuple[dict, dict]]:
+    """
+    Filtert aus den (alt, neu)-Paaren eines ``SeasonCache.apply`` die
+    Spielstandsänderungen laufender (oder gerade beendeter) Spiele.
+    Neue Spiele (alt=None, z. B. erster Load nach Neustart) zählen nicht.
+    """
+    return [
+        (old, new) for old, new in updates
+        if old is not None
+        and new.get("status") in LIVE_STATUSES | {"FINISHED"}
+        and goals(old) != goals(new)
+    ]
+
+
+def goals(match: dict | None) -> tuple[int, int]:
+    """Spielstand für Vergleiche – ein Spiel ohne Score steht 0:0."""
+    return current_score(match) or (0, 0)
+
+
+def goal_line(match: dict) -> str:
+    home, away = current_score(match) or (0, 0)
+    return (
+        f"**{team_name(match['homeTeam'])}** `{home}:{away}` "
+        f"**{team_name(match['awayTeam'])}**{' ✅' if match.get('status') == 'FINISHED' else ' 🔴 LIVE'}"
+    )
+
+
+def next_poll_delay(matches: Iterable[dict], now: datetime) -> float | None:
+    """
+    Sekunden bis zum nächsten Poll:
+    - Spiel live oder Anstoß überfällig → POLL_LIVE_SECONDS
+    - sonst bis zum nächsten Anstoß, höchstens POLL_IDLE_SECONDS
+    - Saison-/Winterpause (> OFFSEASON_GAP) → bis kurz vor Wiederbeginn
+    - keine anstehenden Spiele mehr → None (Poller stoppt)
+    """
+    if any(m.get("status") in LIVE_STATUSES for m in matches):
+        return POLL_LIVE_SECONDS
+
+    kickoffs = [to_dt(m["utcDate"])
+                for m in matches if m.get("status") in UPCOMING_STATUSES]
+    if not kickoffs:
+        return None
+
+    gap = min(kickoffs) - now
+    if gap > OFFSEASON_GAP:
+        return (gap - OFFSEASON_WAKEUP).total_seconds()
+    return max(POLL_LIVE_SECONDS, min(POLL_IDLE_SECONDS, gap.total_seconds()))
+
+
 def format_date_range(fixtures: list[dict]) -> str:
     first_local = to_dt(fixtures[0]["utcDate"]).astimezone(BERLIN_TZ)
     last_local = to_dt(fixtures[-1]["utcDate"]).astimezone(BERLIN_TZ)
@@ -628,8 +898,8 @@ def format_date_range(fixtures: list[dict]) -> str:
     )
 
 
-def fd_get_standings(session: requests.Session) -> dict:
-    return fd_get(session, f"/competitions/{COMP}/standings", params=None)
+async def fd_get_standings(client: FootballDataClient) -> dict:
+    return await client.get(f"/competitions/{COMP}/standings")
 
 
 def form_to_badges(form: str | None) -> str:
@@ -706,4 +976,4 @@ def build_table_embed(standings_block: dict) -> discord.Embed:
 # -------------------- Cog Setup --------------------
 
 async def setup(bot):
-    await bot.add_cog(Buli(bot))
+    await bot.add_cog(Buli(bot, bot.db))
@@ -196,9 +196,9 @@ class Chat(commands.Cog):
 
     image = app_commands.Group(name="image", description="Bilder generieren")
 
-    def __init__(self, bot: commands.Bot, json_model):
+    def __init__(self, bot: commands.Bot, sentences):
         self.bot = bot
-        self.json_model = json_model
+        self.sentences = sentences
 
         # Keys aus ENV
         self.openai_api_key = os.environ["OPENAI_API_KEY"]
@@ -414,12 +414,7 @@ class Chat(commands.Cog):
             return
         await interaction.response.defer(thinking=True)
 
-        text = None
-        for _ in range(10):
-            s = self.json_model.make_sentence(max_overlap_ratio=0.65)
-            if s:
-                text = s
-                break
+        text = await self.sentences.make_sentence(0.65, fallback=None)
         if not text:
             await interaction.followup.send("Konnte grad nix Gescheites generieren. 😅", ephemeral=True)
             return
@@ -651,4 +646,4 @@ class Chat(commands.Cog):
 
 
 async def setup(bot):
-    await bot.add_cog(Chat(bot, bot.json_model))
+    await bot.add_cog(Chat(bot, bot.sentences))
@@ -122,10 +122,6 @@ def is_allowed_author(uid: int) -> bool:
     return uid in user_list and uid not in unerwuenscht
 
 
-async def fetch_random_messages(ch: discord.TextChannel, around: datetime, limit=100):
-    return [m async for m in ch.history(limit=limit, around=around)]
-
-
 def pick_candidates(correct: str, pool: Iterable[str], k: int = 4) -> List[str]:
     cands = {correct}
     pool_list = list(pool)
@@ -253,7 +249,8 @@ class Discordle(commands.Cog):
                 continue
             around = random_date_since(
                 channel_ids.get(ch.id, int(time.time())))
-            msgs = await fetch_random_messages(ch, around, 100)
+            msgs = await self.bot.message_pool.history(
+                ch, cog=self.__class__.__name__, limit=100, around=around)
             random.shuffle(msgs)
             for m in msgs:
                 if (m.content and is_allowed_author(m.author.id)
@@ -268,7 +265,8 @@ class Discordle(commands.Cog):
                 continue
             around = random_date_since(
                 channel_ids.get(ch.id, int(time.time())))
-            msgs = await fetch_random_messages(ch, around, 100)
+            msgs = await self.bot.message_pool.history(
+                ch, cog=self.__class__.__name__, limit=100, around=around)
             random.shuffle(msgs)
             for m in msgs:
                 if is_allowed_author(m.author.id) and m.attachments:
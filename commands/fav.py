@@ -1,23 +1,162 @@
 import logging
+import random
+import time
 from collections.abc import Sequence
-import os
+from datetime import datetime, timedelta
 
 import discord
 import pytz
 from dateutil import tz
+from discord import app_commands
 from discord.ext import commands
 from discord.raw_models import RawReactionActionEvent
 
+from utils.fav_index import FavIdIndex, FavNameIndex
 from utils.logging_helper import log_event
 
 logger = logging.getLogger("ZicklaaBotRewrite.Fav")
 
+FAVS_PER_PAGE = 10
+EXCERPT_CHARS = 300
+# Anhang-Links im Discord-CDN laufen ab → Snapshots nach einem Tag neu holen
+SNAPSHOT_MAX_AGE = timedelta(days=1)
+
+# Spaltenpositionen in "SELECT * FROM favs"
+AUTHOR, EXCERPT, ATTACHMENT_URL, JUMP_URL, CREATED_AT, SNAPSHOT_AT, GONE = range(5, 12)
+
+
+def message_snapshot(message: discord.Message) -> tuple:
+    """Snapshot-Spalten (author … snapshot_at) für eine Nachricht."""
+    return (
+        message.author.name,
+        message.content[:EXCERPT_CHARS],
+        str(message.attachments[0].url) if message.attachments else None,
+        message.jump_url,
+        message.created_at.timestamp(),
+        time.time(),
+    )
+
+
+def snapshot_stale(fav: tuple) -> bool:
+    if fav[GONE]:
+        return False
+    return fav[SNAPSHOT_AT] is None or time.time() - fav[SNAPSHOT_AT] > SNAPSHOT_MAX_AGE.total_seconds()
+
+
+def _truncate(s: str, n: int) -> str:
+    return s if len(s) <= n else s[: n - 1] + "…"
+
+
+def _fav_field(fav: tuple) -> tuple[str, str]:
+    name = _truncate(f"{fav[0]} | {fav[3]}", 256)
+    if fav[SNAPSHOT_AT] is None:
+        return name, "(wird geladen …)"
+    if fav[CREATED_AT] is None:
+        # gelöscht, bevor es je einen Snapshot gab
+        return name, "🗑️ Originalnachricht gelöscht"
+    when = datetime.fromtimestamp(fav[CREATED_AT], tz.tzlocal()).strftime("%d.%m.%Y, %H:%M")
+    lines = [f"**{fav[AUTHOR]}** · {when}"]
+    lines.append(_truncate(fav[EXCERPT], 200) if fav[EXCERPT] else "Kein Text in der Originalnachricht!")
+    links = [f"[Zur Nachricht]({fav[JUMP_URL]})"]
+    if fav[ATTACHMENT_URL]:
+        links.append(f"[Anhang]({fav[ATTACHMENT_URL]})")
+    lines.append(" · ".join(links))
+    if fav[GONE]:
+        lines.append("🗑️ Originalnachricht gelöscht")
+    return name, _truncate("\n".join(lines), 1024)
+
+
+class FavListView(discord.ui.View):
+    """
+    Paginierte Fav-Liste aus den gespeicherten Snapshots. Nur die gerade
+    sichtbare Seite wird bei veralteten/fehlenden Snapshots nachgeladen.
+    """
+
+    def __init__(self, cog, *, user: discord.abc.User, records: list[tuple]):
+        super().__init__(timeout=600)
+        self.cog = cog
+        self.user = user
+        self.records = list(records)
+        self.page = 0
+        self.total = max(1, -(-len(self.records) // FAVS_PER_PAGE))
+        self.message = None
+        self._update_buttons()
+
+    def _update_buttons(self):
+        self.prev_btn.disabled = self.page <= 0
+        self.next_btn.disabled = self.page >= (self.total - 1)
+
+    def _visible(self) -> range:
+        start = self.page * FAVS_PER_PAGE
+        return range(start, min(start + FAVS_PER_PAGE, len(self.records)))
+
+    def make_embed(self) -> discord.Embed:
+        embed = discord.Embed(title="🦶 Deine Favs", color=0x00FF00)
+        for i in self._visible():
+            name, value = _fav_field(self.records[i])
+            embed.add_field(name=name, value=value, inline=False)
+        embed.set_footer(
+            text=f"Seite {self.page + 1}/{self.total} • {len(self.records)} Favs insgesamt")
+        return embed
+
+    async def revalidate_page(self):
+        """Snapshots der sichtbaren Seite auffrischen (ein Batch) und neu rendern."""
+        stale = [i for i in self._visible() if snapshot_stale(self.records[i])]
+        if not stale:
+            return
+        try:
+            rows = await self.cog.revalidate([self.records[i] for i in stale])
+        except Exception as e:
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Fav revalidate failed",
+                self.user,
+                self.user.id,
+                page=self.page,
+                error=e,
+            )
+            return
+        for i, row in zip(stale, rows):
+            self.records[i] = row
+        if self.message is not None:
+            await self.message.edit(embed=self.make_embed(), view=self)
+
+    async def _turn(self, interaction: discord.Interaction, page: int):
+        self.page = max(0, min(page, self.total - 1))
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.make_embed(), view=self)
+        await self.revalidate_page()
+
+    @discord.ui.button(label="⬅️ Zurück", style=discord.ButtonStyle.secondary)
+    async def prev_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._turn(interaction, self.page - 1)
+
+    @discord.ui.button(label="Weiter ➡️", style=discord.ButtonStyle.secondary)
+    async def next_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._turn(interaction, self.page + 1)
+
 
 class Fav(commands.Cog):
     def __init__(self, bot, db):
         self.bot = bot
         self.db = db
-        self.cursor = db.cursor()
+        # Spiegel von favs: Namensindex pro User + ID-Listen für Zufallsauswahl
+        self.names = FavNameIndex()
+        self.ids = FavIdIndex()
+
+    async def cog_load(self):
+        rows = await self.db.fetchall("SELECT id, user_id, name, channel_id FROM favs")
+        self.names.load((fav_id, user_id, name) for fav_id, user_id, name, _ in rows)
+        self.ids.load((fav_id, user_id, channel_id) for fav_id, user_id, _, channel_id in rows)
+        log_event(
+            logger,
+            logging.INFO,
+            self.__class__.__name__,
+            "fav_index_loaded",
+            count=len(self.names),
+        )
 
     # ------------------------------------------------------
     # Reaction Event Listener
@@ -31,21 +170,22 @@ class Fav(commands.Cog):
         if str(emoji) == "🗑️":
             try:
                 if user_id != 571051961256902671:
-                    channel = self.bot.get_channel(channel_id)
-                    msg = await channel.fetch_message(message_id)
-                    if msg.embeds:
+                    msg = await self.bot.message_pool.fetch(
+                        channel_id, message_id, cog=self.__class__.__name__)
+                    if msg and msg.embeds:
                         embedFromMessage = msg.embeds[0]
                         footer = embedFromMessage.footer.text
 
                         split_footer = footer.split()
                         fav_id = split_footer[0]
-                        fav = self.cursor.execute(
+                        fav = await self.db.fetchone(
                             "SELECT * FROM favs WHERE id=?", (fav_id,)
-                        ).fetchone()
+                        )
                         if fav and fav[1] == user_id:
-                            self.cursor.execute(
+                            await self.db.execute(
                                 "DELETE FROM favs WHERE id=?", (fav_id,))
-                            self.db.commit()
+                            self.names.remove(fav[0])
+                            self.ids.remove(fav[0])
                             log_event(
                                 logger,
                                 logging.INFO,
@@ -70,6 +210,8 @@ class Fav(commands.Cog):
         # 🦶 = Save Fav
         if str(emoji) == "🦶":
             try:
+                # Snapshot jetzt ziehen – die Nachricht kann bis zur Namensantwort weg sein
+                snapshot = await self.snapshot_for(channel_id, message_id)
                 user = await self.bot.fetch_user(payload.user_id)
                 dm_channel = await user.create_dm()
                 await dm_channel.send("Antworte bitte mit dem gewünschten Namen für den Fav.")
@@ -86,10 +228,15 @@ class Fav(commands.Cog):
                 response = await self.bot.wait_for("message", check=message_check(channel=dm_channel))
                 name = response.content
                 if len(name) < 250:
-                    sql = "INSERT INTO favs (user_id, message_id, name, channel_id) VALUES (?, ?, ?, ?)"
-                    val = (user_id, message_id, name, channel_id)
-                    self.cursor.execute(sql, val)
-                    self.db.commit()
+                    sql = (
+                        "INSERT INTO favs (user_id, message_id, name, channel_id, "
+                        "author, excerpt, attachment_url, jump_url, created_at, snapshot_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                    )
+                    val = (user_id, message_id, name, channel_id, *snapshot)
+                    fav_id = await self.db.insert(sql, val)
+                    self.names.add(user_id, fav_id, name)
+                    self.ids.add(fav_id, user_id, channel_id)
                     await response.add_reaction("👍")
                     log_event(
                         logger,
@@ -130,21 +277,18 @@ class Fav(commands.Cog):
     async def fav(self, ctx, *, name: str = None):
         try:
             if name:
-                name = f"%{name}%"
-                fav = self.cursor.execute(
-                    "SELECT * FROM favs WHERE user_id=? AND name LIKE ? ORDER BY RANDOM()",
-                    (ctx.author.id, name),
-                ).fetchone()
+                # exakt → Teilstring → unscharf, ohne Table-Scan
+                fav_ids = self.names.find(ctx.author.id, name)
+                fav_id = random.choice(fav_ids) if fav_ids else None
             else:
-                fav = self.cursor.execute(
-                    "SELECT * FROM favs WHERE user_id=? ORDER BY RANDOM()",
-                    (ctx.author.id,),
-                ).fetchone()
+                fav_id = self.ids.pick(user_id=ctx.author.id)
+            fav = await self.get_fav(fav_id)
 
             if fav:
                 try:
-                    channel = self.bot.get_channel(fav[4])
-                    fav_message = await channel.fetch_message(fav[2])
+                    fav_message = await self.fetch_fav_message(fav)
+                    if snapshot_stale(fav):
+                        await self.store_snapshot(fav[0], message_snapshot(fav_message))
 
                     current_time = fav_message.created_at.astimezone(
                         tz.tzlocal()).strftime("%d.%m.%Y, %H:%M:%S")
@@ -212,18 +356,33 @@ class Fav(commands.Cog):
                 exc_info=True,
             )
 
+    @fav.autocomplete("name")
+    async def fav_name_autocomplete(self, interaction: discord.Interaction, current: str):
+        # rein In-Memory, keine DB-Abfrage pro Tastendruck
+        return [
+            app_commands.Choice(name=name[:100], value=name[:100])
+            for name in self.names.complete(interaction.user.id, current)
+        ]
+
     # ------------------------------------------------------
     # /rfav -> Random Fav von allen Usern
     # ------------------------------------------------------
     @commands.hybrid_command(description="Zeige einen zufälligen Fav von allen Usern.")
-    async def rfav(self, ctx):
+    @app_commands.describe(
+        user="Nur Favs dieses Users",
+        channel="Nur Favs aus diesem Channel",
+    )
+    async def rfav(self, ctx, user: discord.User = None, channel: discord.TextChannel = None):
         try:
-            fav = self.cursor.execute(
-                "SELECT * FROM favs ORDER BY RANDOM()").fetchone()
+            fav = await self.get_fav(self.ids.pick(
+                user_id=user.id if user else None,
+                channel_id=channel.id if channel else None,
+            ))
             if fav:
                 try:
-                    channel = self.bot.get_channel(fav[4])
-                    fav_message = await channel.fetch_message(fav[2])
+                    fav_message = await self.fetch_fav_message(fav)
+                    if snapshot_stale(fav):
+                        await self.store_snapshot(fav[0], message_snapshot(fav_message))
 
                     current_time = fav_message.created_at.astimezone(
                         tz.tzlocal()).strftime("%d.%m.%Y, %H:%M:%S")
@@ -270,6 +429,8 @@ class Fav(commands.Cog):
                         error=e,
                         exc_info=True,
                     )
+            else:
+                await ctx.reply("Keine Favs gefunden 🔍")
         except Exception as e:
             await ctx.reply("Klappt nit lol 🤷")
             log_event(
@@ -285,81 +446,19 @@ class Fav(commands.Cog):
             )
 
     # ------------------------------------------------------
-    # /allfavs -> Export als TXT per DM
+    # /allfavs -> Liste aller Favs per DM (aus Snapshots)
     # ------------------------------------------------------
-    @commands.hybrid_command(description="Exportiere alle deine Favs als Textdatei.")
+    @commands.hybrid_command(description="Schicke dir eine Liste aller deiner Favs per DM.")
     async def allfavs(self, ctx):
         try:
-            all_favs = self.cursor.execute(
-                "SELECT * FROM favs WHERE user_id=?", (ctx.author.id,)
+            all_favs = await self.db.fetchall(
+                "SELECT * FROM favs WHERE user_id=? ORDER BY id", (ctx.author.id,)
             )
             if all_favs:
                 dm_channel = await ctx.author.create_dm()
                 await ctx.message.delete()
-                await dm_channel.send("Moin 👋 Ich sammele alle deine Favs für dich...")
-                log_event(
-                    logger,
-                    logging.INFO,
-                    self.__class__.__name__,
-                    "DM sent for allfavs",
-                    ctx.author,
-                    ctx.author.id,
-                    command="/allfavs",
-                )
-
-                path = f"allfavs/{ctx.author.id}.txt"
-
-                try:
-                    os.remove(path)
-                except OSError:
-                    pass
-
-                whole_message = ""
-                for fav in all_favs:
-                    try:
-                        channel = self.bot.get_channel(fav[4])
-                        fav_message = await channel.fetch_message(fav[2])
-
-                        current_time = fav_message.created_at.astimezone(
-                            tz.tzlocal()).strftime("%d.%m.%Y, %H:%M:%S")
-                        author = fav_message.author.name
-                        text = fav_message.content
-                        bottom_text = (
-                            f"{fav[0]} | {current_time} | #{fav_message.channel.name} | by: {ctx.author.name} | Name: {fav[3]}"
-                        )
-
-                        if fav_message.content:
-                            if fav_message.attachments:
-                                url = str(fav_message.attachments[0].url)
-                                message = f"{author}\n{text}\n{url}\n{bottom_text}\n\n"
-                            else:
-                                message = f"{author}\n{text}\n{bottom_text}\n\n"
-                        else:
-                            if fav_message.attachments:
-                                url = str(fav_message.attachments[0].url)
-                                message = f"{author}\n{url}\n{bottom_text}\n\n"
-                            else:
-                                message = f"{author}\n{bottom_text}\n\n"
-
-                        whole_message += message
-                    except Exception as e:
-                        log_event(
-                            logger,
-                            logging.ERROR,
-                            self.__class__.__name__,
-                            "Allfavs fetch failed",
-                            ctx.author,
-                            ctx.author.id,
-                            command="/allfavs",
-                            fav_id=fav[0],
-                            error=e,
-                            exc_info=True,
-                        )
-
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(whole_message)
-
-                await dm_channel.send(file=discord.File(path))
+                view = FavListView(self, user=ctx.author, records=all_favs)
+                view.message = await dm_channel.send(embed=view.make_embed(), view=view)
                 log_event(
                     logger,
                     logging.INFO,
@@ -368,8 +467,10 @@ class Fav(commands.Cog):
                     ctx.author,
                     ctx.author.id,
                     command="/allfavs",
-                    file=path,
+                    favs=len(all_favs),
+                    pages=view.total,
                 )
+                await view.revalidate_page()
             else:
                 await ctx.message.add_reaction("⛔")
                 await ctx.message.add_reaction("🔍")
@@ -390,6 +491,64 @@ class Fav(commands.Cog):
     # ------------------------------------------------------
     # Hilfsfunktionen
     # ------------------------------------------------------
+    async def snapshot_for(self, channel_id, message_id):
+        """Snapshot-Spalten der Nachricht oder lauter ``None``, falls nicht abrufbar."""
+        try:
+            message = await self.bot.message_pool.fetch(
+                channel_id, message_id, cog=self.__class__.__name__)
+            if message is not None:
+                return message_snapshot(message)
+        except Exception as e:
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "Fav snapshot failed",
+                channel_id=channel_id,
+                message_id=message_id,
+                error=e,
+            )
+        return (None,) * 6
+
+    async def store_snapshot(self, fav_id, snapshot):
+        await self.db.execute(
+            "UPDATE favs SET author=?, excerpt=?, attachment_url=?, jump_url=?, "
+            "created_at=?, snapshot_at=?, gone=0 WHERE id=?",
+            (*snapshot, fav_id),
+        )
+
+    async def fetch_fav_message(self, fav):
+        message = await self.bot.message_pool.fetch(fav[4], fav[2], cog=self.__class__.__name__)
+        if message is None:
+            raise LookupError(f"Originalnachricht {fav[2]} nicht mehr abrufbar")
+        return message
+
+    async def revalidate(self, favs):
+        """
+        Holt die Originalnachrichten mehrerer Favs (gebündelt über den
+        Message-Pool) und aktualisiert ihre Snapshots. Gibt die neuen Zeilen
+        zurück (bei gelöschter Nachricht mit ``gone=1`` und altem Snapshot).
+        """
+        messages = await self.bot.message_pool.fetch_many(
+            [(fav[4], fav[2]) for fav in favs], cog=self.__class__.__name__)
+        rows = []
+        for fav, message in zip(favs, messages):
+            if message is None:
+                now = time.time()
+                await self.db.execute(
+                    "UPDATE favs SET snapshot_at=?, gone=1 WHERE id=?", (now, fav[0]))
+                rows.append((*fav[:SNAPSHOT_AT], now, 1))
+                continue
+            snapshot = message_snapshot(message)
+            await self.store_snapshot(fav[0], snapshot)
+            rows.append((*fav[:AUTHOR], *snapshot, 0))
+        return rows
+
+    async def get_fav(self, fav_id):
+        if fav_id is None:
+            return None
+        return await self.db.fetchone("SELECT * FROM favs WHERE id=?", (fav_id,))
+
     def parse_raw_reaction_event(self, payload: RawReactionActionEvent):
         return payload.message_id, payload.channel_id, payload.emoji, payload.user_id
 
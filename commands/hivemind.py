@@ -27,9 +27,9 @@ SPAM_CHANNEL_ID = 528742785935998979
 class Hivemind(commands.Cog):
     """Cog für zufällige Sätze aus dem Hivemind (Markov-Modell)."""
 
-    def __init__(self, bot, json_model):
+    def __init__(self, bot, sentences):
         self.bot = bot
-        self.json_model = json_model
+        self.sentences = sentences
 
     @app_commands.command(
         name="hm",
@@ -38,11 +38,8 @@ class Hivemind(commands.Cog):
     async def hm(self, interaction: discord.Interaction):
         """Slash-Command: /hm – Ein zufälliger Satz."""
         try:
-            while True:
-                satz = self.json_model.make_sentence(max_overlap_ratio=ratio)
-                if satz:
-                    await interaction.response.send_message(satz, allowed_mentions=am)
-                    break
+            satz = await self.sentences.make_sentence(ratio)
+            await interaction.response.send_message(satz, allowed_mentions=am)
             log_event(
                 logger,
                 logging.INFO,
@@ -87,15 +84,11 @@ class Hivemind(commands.Cog):
             await interaction.response.defer(thinking=True, ephemeral=False)
 
             for _ in range(5):
-                while True:
-                    satz = self.json_model.make_sentence(
-                        max_overlap_ratio=ratio)
-                    if satz:
-                        await interaction.channel.send(
-                            satz,
-                            allowed_mentions=discord.AllowedMentions.none()
-                        )
-                        break
+                satz = await self.sentences.make_sentence(ratio)
+                await interaction.channel.send(
+                    satz,
+                    allowed_mentions=discord.AllowedMentions.none()
+                )
 
             try:
                 await interaction.delete_original_response()
@@ -136,4 +129,4 @@ class Hivemind(commands.Cog):
 
 async def setup(bot: commands.Bot):
     """Fügt das Hivemind-Cog dem Bot hinzu."""
-    await bot.add_cog(Hivemind(bot, bot.json_model))
+    await bot.add_cog(Hivemind(bot, bot.sentences))
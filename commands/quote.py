@@ -60,15 +60,15 @@ class Quote(commands.Cog):
         """
         guild_id, channel_id, msg_id = self._parse_message_link(link)
         channel = self._resolve_channel(guild_id, channel_id)
-        if channel is None:
-            # Notfalls hart fetchen (falls nicht im Cache / andere Guild)
-            # kann Forbidden werfen
-            channel = await self.bot.fetch_channel(channel_id)
-        assert isinstance(channel, (discord.TextChannel, discord.Thread)
-                          ), "Nur Textkanäle/Threads werden unterstützt."
-
-        # kann NotFound/Forbidden werfen
-        message = await channel.fetch_message(msg_id)
+        if channel is not None:
+            assert isinstance(channel, (discord.TextChannel, discord.Thread)
+                              ), "Nur Textkanäle/Threads werden unterstützt."
+
+        # geteilter Cache; unbekannte Channels fetcht der Pool selbst
+        message = await self.bot.message_pool.fetch(
+            channel_id, msg_id, cog=self.__class__.__name__)
+        if message is None:
+            raise RuntimeError("Nachricht nicht gefunden oder kein Zugriff.")
 
         # Beschreibung beschneiden, damit wir nie über 4096 kommen
         content = (message.content or "").strip()
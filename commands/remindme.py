@@ -18,6 +18,7 @@ import asyncio
 import logging
 import os
 import time
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional, Literal
 
@@ -28,6 +29,7 @@ from dateutil import tz
 
 from utils.parser import RemindmeParser
 from utils.logging_helper import log_event
+from utils.reminder_scheduler import ReminderScheduler
 
 
 # ============================================================================
@@ -41,6 +43,10 @@ globalPfad = os.environ["globalPfad"]
 with open(os.path.join(globalPfad, "utils/rm_grammar.peg"), "r", encoding="utf-8") as _f:
     GRAMMAR = _f.read()
 
+# Nachholen überfälliger Reminder: parallele Channels & Pause pro Nachricht
+CATCHUP_WORKERS = 4
+CATCHUP_SEND_INTERVAL = 1.0
+
 
 # ============================================================================
 # Datenmodell & Helper
@@ -252,13 +258,28 @@ class RemindMe(commands.Cog):
     remindme = app_commands.Group(
         name="remindme", description="Erinnerungen setzen")
 
-    def __init__(self, bot, db, json_model):
+    def __init__(self, bot, db, sentences):
         self.bot = bot
         self.db = db
-        self.json_model = json_model
-        self.cursor = db.cursor()
+        self.sentences = sentences
         self.global_state = {}
         self.parser = RemindmeParser(GRAMMAR)
+        self.scheduler = ReminderScheduler(self.deliver_due_reminders)
+        self._startup_task: Optional[asyncio.Task] = None
+
+    async def cog_load(self):
+        # Auch nach /reload bzw. /db_import: Scheduler startet, sobald der Bot bereit ist
+        self._startup_task = asyncio.create_task(self._start_when_ready())
+
+    async def cog_unload(self):
+        if self._startup_task is not None:
+            self._startup_task.cancel()
+            self._startup_task = None
+        self.scheduler.stop()
+
+    async def _start_when_ready(self):
+        await self.bot.wait_until_ready()
+        await self.check_reminder()
 
     # ----------------------------------------------------------------------
     # /remindme in — Zeitspanne
@@ -299,7 +320,7 @@ class RemindMe(commands.Cog):
         reminder = Reminder(public_msg.id, interaction.channel_id,
                             interaction.user.id, text or "", ts)
 
-        reminder = self.insert_reminder(reminder)
+        reminder = await self.insert_reminder(reminder)
         log_event(
             logger,
             logging.INFO,
@@ -375,7 +396,7 @@ class RemindMe(commands.Cog):
             reminder = Reminder(
                 public_msg.id, interaction.channel_id, interaction.user.id, reason, ts)
 
-            reminder = self.insert_reminder(reminder)
+            reminder = await self.insert_reminder(reminder)
             log_event(
                 logger,
                 logging.INFO,
@@ -413,21 +434,30 @@ class RemindMe(commands.Cog):
         await self.get_all_reminders(interaction)
 
     # ============================================================================
-    # Background-Task (von bot.on_ready gestartet)
+    # Background-Task (von cog_load gestartet, sobald der Bot bereit ist)
     # ============================================================================
 
     async def check_reminder(self):
-        """Prüft regelmäßig, ob ein Reminder fällig ist, und sendet ihn dann."""
+        """Baut den Reminder-Heap aus der DB auf und startet den Scheduler."""
+        if self.scheduler.running:
+            return
         try:
-            while True:
-                self.cursor.execute(
-                    "SELECT * FROM reminders ORDER BY reminder_time ASC LIMIT 1")
-                results = self.cursor.fetchall()
-                if results:
-                    reminder = reminder_from_record(results[0])
-                    if (reminder.time - time.time()) < 0:
-                        await self.send_reminder(reminder)
-                await asyncio.sleep(10)
+            records = await self.db.fetchall(
+                "SELECT * FROM reminders ORDER BY reminder_time ASC")
+            reminders = [reminder_from_record(r) for r in records]
+            now_ts = time.time()
+            overdue = [r for r in reminders if r.time <= now_ts]
+            self.scheduler.load(r for r in reminders if r.time > now_ts)
+            self.scheduler.start()
+            log_event(
+                logger,
+                logging.INFO,
+                self.__class__.__name__,
+                "reminder_scheduler_started",
+                pending=len(self.scheduler),
+                overdue=len(overdue),
+            )
+            await self.catch_up_reminders(overdue)
         except Exception as e:
 
             log_event(
@@ -439,6 +469,11 @@ class RemindMe(commands.Cog):
                 exc_info=True,
             )
 
+    async def deliver_due_reminders(self, reminders: list[Reminder]):
+        """Callback des Schedulers: sendet alle fälligen Reminder."""
+        for reminder in reminders:
+            await self.send_reminder(reminder)
+
     # ============================================================================
     # DB / Utility
     # ============================================================================
@@ -447,10 +482,10 @@ class RemindMe(commands.Cog):
         """Ephemere, paginierte Liste aller eigenen Reminder (Navigation aus Cache, kein DB-Reload)."""
         try:
             user_id = interaction.user.id
-            records = self.cursor.execute(
+            records = await self.db.fetchall(
                 "SELECT * FROM reminders WHERE user_id=? ORDER BY reminder_time ASC",
                 (user_id,),
-            ).fetchall()
+            )
 
             if not records:
                 await interaction.response.send_message("Du hast aktuell **keine** anstehenden Reminder. 🎉", ephemeral=True)
@@ -484,24 +519,17 @@ class RemindMe(commands.Cog):
             else:
                 await interaction.response.send_message("❌ Konnte deine Reminder nicht laden.", ephemeral=True)
 
-    def insert_reminder(self, reminder: Reminder):
+    async def insert_reminder(self, reminder: Reminder):
         """Fügt einen Reminder in die Datenbank ein."""
         try:
             sql = """INSERT INTO reminders (user_id, reminder_text, reminder_time, channel, message_id, parent_id)
                      VALUES (?, ?, ?, ?, ?, ?)"""
             val = (reminder.user_id, reminder.text, reminder.time,
                    reminder.channel_id, reminder.message_id, reminder._parent_id)
-            self.cursor.execute(sql, val)
-            self.db.commit()
-
-            self.cursor.execute(
-                "SELECT id FROM reminders WHERE user_id=? AND reminder_text=? AND reminder_time=? AND message_id=?",
-                (reminder.user_id, reminder.text,
-                 reminder.time, reminder.message_id),
-            )
-            new_id = self.cursor.fetchall()[0][0]
+            new_id = await self.db.insert(sql, val)
 
             reminder._id = new_id
+            self.scheduler.push(reminder)
             log_event(
                 logger,
                 logging.INFO,
@@ -529,33 +557,16 @@ class RemindMe(commands.Cog):
         """Sendet einen fälligen Reminder und löscht ihn danach."""
         try:
             if not await self.check_reminder_exists(reminder):
-                self.delete_reminder(reminder)
+                await self.delete_reminder(reminder)
                 return
 
             channel = self.bot.get_channel(reminder.channel_id)
             if not channel:
-                self.delete_reminder(reminder)
+                await self.delete_reminder(reminder)
                 return
 
-            parent_msg = None
-            try:
-                parent_msg = await channel.fetch_message(reminder.message_id)
-            except discord.NotFound:
-                pass
-
-            if reminder.text:
-                content = reminder.text
-            else:
-                while True:
-                    content = self.json_model.make_sentence(
-                        max_overlap_ratio=0.67)
-                    if content:
-                        break
-
-            content = f"⏰ <@{reminder.user_id}> \nIch werde dich wissen lassen:\n**{content}**"
-
             if reminder._id != self.global_state.get("reminder_id"):
-                self.delete_reminder(reminder)
+                await self.delete_reminder(reminder)
                 self.global_state["reminder_id"] = reminder._id
 
                 log_event(
@@ -569,10 +580,7 @@ class RemindMe(commands.Cog):
                     channel_id=reminder.channel_id,
                 )
 
-                if parent_msg:
-                    await parent_msg.reply(content, mention_author=True)
-                else:
-                    await channel.send(content)
+                await self._post_reminder(channel, reminder)
 
         except Exception as e:
 
@@ -588,11 +596,96 @@ class RemindMe(commands.Cog):
                 exc_info=True,
             )
 
+    async def _reminder_content(self, reminder: Reminder) -> str:
+        """Baut den Erinnerungstext (ohne eigenen Text → Hivemind-Satz)."""
+        if reminder.text:
+            content = reminder.text
+        else:
+            content = await self.sentences.make_sentence(0.67)
+        return f"⏰ <@{reminder.user_id}> \nIch werde dich wissen lassen:\n**{content}**"
+
+    async def _post_reminder(self, channel, reminder: Reminder):
+        """Antwortet auf die Bestätigungs-Nachricht (ohne sie vorher zu fetchen)."""
+        reference = discord.MessageReference(
+            message_id=reminder.message_id,
+            channel_id=reminder.channel_id,
+            fail_if_not_exists=False,
+        )
+        await channel.send(
+            await self._reminder_content(reminder),
+            reference=reference,
+            mention_author=True,
+        )
+
+    async def catch_up_reminders(self, reminders: list[Reminder]):
+        """
+        Liefert überfällige Reminder (z. B. nach Downtime) gesammelt aus:
+        - eine DELETE-Transaktion für alle,
+        - gruppiert nach Channel, pro Channel nacheinander mit Pause,
+        - max. CATCHUP_WORKERS Channels parallel.
+        """
+        if not reminders:
+            return
+        started = time.monotonic()
+
+        by_channel: dict[int, list[Reminder]] = defaultdict(list)
+        for reminder in reminders:
+            by_channel[reminder.channel_id].append(reminder)
+
+        await self.delete_reminders(reminders)
+
+        queue: asyncio.Queue[list[Reminder]] = asyncio.Queue()
+        for batch in by_channel.values():
+            queue.put_nowait(batch)
+        delivered = 0
+
+        async def worker():
+            nonlocal delivered
+            while True:
+                try:
+                    batch = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                channel = self.bot.get_channel(batch[0].channel_id)
+                if not channel:
+                    continue
+                for reminder in batch:
+                    try:
+                        await self._post_reminder(channel, reminder)
+                        delivered += 1
+                    except Exception as e:
+                        log_event(
+                            logger,
+                            logging.ERROR,
+                            self.__class__.__name__,
+                            "catch_up_send_failed",
+                            user=None,
+                            user_id=reminder.user_id,
+                            reminder_id=reminder._id,
+                            error=e,
+                            exc_info=True,
+                        )
+                    await asyncio.sleep(CATCHUP_SEND_INTERVAL)
+
+        workers = min(CATCHUP_WORKERS, len(by_channel))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        log_event(
+            logger,
+            logging.INFO,
+            self.__class__.__name__,
+            "reminder_catch_up_done",
+            overdue=len(reminders),
+            delivered=delivered,
+            channels=len(by_channel),
+            duration_s=round(time.monotonic() - started, 2),
+        )
+
     async def check_reminder_exists(self, reminder: Reminder):
         """Prüft, ob ein Reminder noch in der Datenbank existiert."""
         try:
-            res = self.cursor.execute(
-                "SELECT * FROM reminders where id=?", (reminder._id,)).fetchone()
+            res = await self.db.fetchone(
+                "SELECT * FROM reminders where id=?", (reminder._id,))
             return bool(res)
         except Exception as e:
 
@@ -610,12 +703,11 @@ class RemindMe(commands.Cog):
 
             return False
 
-    def delete_reminder(self, reminder: Reminder):
+    async def delete_reminder(self, reminder: Reminder):
         """Löscht einen Reminder aus der Datenbank."""
         try:
-            self.cursor.execute(
+            await self.db.execute(
                 "DELETE FROM reminders WHERE id=?", (reminder._id,))
-            self.db.commit()
 
             log_event(
                 logger,
@@ -637,6 +729,33 @@ class RemindMe(commands.Cog):
                 exc_info=True,
             )
 
+    async def delete_reminders(self, reminders: list[Reminder]):
+        """Löscht mehrere Reminder in einer Transaktion."""
+        ids = [(r._id,) for r in reminders]
+        try:
+            await self.db.executemany(
+                "DELETE FROM reminders WHERE id=?", ids)
+
+            log_event(
+                logger,
+                logging.INFO,
+                self.__class__.__name__,
+                "db_delete_reminders",
+                user=None,
+                count=len(ids),
+            )
+        except Exception as e:
+            log_event(
+                logger,
+                logging.ERROR,
+                self.__class__.__name__,
+                "db_delete_reminders_failed",
+                user=None,
+                count=len(ids),
+                error=e,
+                exc_info=True,
+            )
+
 
 # ============================================================================
 # Cog-Setup
@@ -644,4 +763,4 @@ class RemindMe(commands.Cog):
 
 async def setup(bot):
     """Fügt das RemindMe-Cog dem Bot hinzu."""
-    await bot.add_cog(RemindMe(bot, bot.db, bot.json_model))
+    await bot.add_cog(RemindMe(bot, bot.db, bot.sentences))
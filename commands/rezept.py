@@ -117,6 +117,8 @@ class Rezept(commands.Cog):
                 )
                 return
 
+            # Pin liegt schon vor → Quote-Cog muss ihn nicht erneut fetchen
+            self.bot.message_pool.prime([message])
             embed = await quote_cog.build_quote_embed_from_link(message.jump_url)
             await interaction.followup.send(embed=embed)
             log_event(
@@ -31,6 +31,12 @@ EXT_LIST = [
 ]
 SAVE_PATH = os.path.join(globalPfad, "LustigeBildchen/")
 
+
+def star_count(message: discord.Message) -> int:
+    """Anzahl der ⭐-Reaktionen einer Nachricht."""
+    return next((r.count for r in message.reactions if str(r.emoji) == "⭐"), 0)
+
+
 # -------------------- Cog-Klasse --------------------
 
 
@@ -40,7 +46,19 @@ class Star(commands.Cog):
     def __init__(self, bot, db):
         self.bot = bot
         self.db = db
-        self.cursor = db.cursor()
+        # Bereits gepostete Message-IDs (Spiegel der stars-Tabelle)
+        self.posted_stars: set[int] = set()
+
+    async def cog_load(self):
+        rows = await self.db.fetchall("SELECT message_id FROM stars")
+        self.posted_stars = {row[0] for row in rows}
+        log_event(
+            logger,
+            logging.INFO,
+            self.__class__.__name__,
+            "posted_stars_loaded",
+            count=len(self.posted_stars),
+        )
 
     # --- Hilfsmethoden ---
 
@@ -129,31 +147,71 @@ class Star(commands.Cog):
 
         return embed
 
-    async def post_star(self, message: discord.Message):
-        """Postet die Stern-Nachricht ins Sternbrett + DB-Eintrag."""
-        embed = await self.build_star_embed(message)
-        star_channel = self.bot.get_channel(POST_CHANNEL_ID)
-        star_message = await star_channel.send(embed=embed)
-        await star_message.add_reaction("⭐")
+    async def bump_star_count(self, message_id: int, channel_id: int, delta: int) -> int:
+        """Ändert den persistierten ⭐-Zähler um ``delta`` und gibt den neuen Wert zurück."""
+        def _bump(conn):
+            conn.execute(
+                """
+                INSERT INTO star_counts (message_id, channel_id, count) VALUES (?, ?, MAX(?, 0))
+                ON CONFLICT(message_id) DO UPDATE SET count = MAX(count + ?, 0)
+                """,
+                (int(message_id), int(channel_id), delta, delta),
+            )
+            row = conn.execute(
+                "SELECT count FROM star_counts WHERE message_id=?", (int(message_id),)
+            ).fetchone()
+            if row[0] == 0:
+                conn.execute(
+                    "DELETE FROM star_counts WHERE message_id=?", (int(message_id),))
+            return row[0]
+
+        return await self.db.run(_bump)
+
+    async def set_star_count(self, message_id: int, channel_id: int, count: int):
+        """Setzt den ⭐-Zähler auf einen bekannten (echten) Wert."""
+        await self.db.execute(
+            """
+            INSERT INTO star_counts (message_id, channel_id, count) VALUES (?, ?, ?)
+            ON CONFLICT(message_id) DO UPDATE SET count = excluded.count
+            """,
+            (int(message_id), int(channel_id), int(count)),
+        )
+
+    async def claim_star(self, message_id: int) -> bool:
+        """
+        Reserviert eine Nachricht fürs Sternbrett (Set + INSERT OR IGNORE).
+        Gibt False zurück, wenn sie schon gepostet/reserviert ist.
+        """
+        message_id = int(message_id)
+        if message_id in self.posted_stars:
+            return False
+        # Set zuerst (ohne await dazwischen) → parallele Reactions sehen den Claim sofort
+        self.posted_stars.add(message_id)
+        inserted = await self.db.execute(
+            "INSERT OR IGNORE INTO stars (message_id) VALUES (?)", (message_id,)
+        )
+        return inserted > 0
+
+    async def release_star(self, message_id: int):
+        """Gibt eine Reservierung wieder frei (Posten fehlgeschlagen)."""
+        self.posted_stars.discard(int(message_id))
+        await self.db.execute(
+            "DELETE FROM stars WHERE message_id=?", (int(message_id),)
+        )
+
+    async def post_star(self, message: discord.Message) -> bool:
+        """Postet die Stern-Nachricht ins Sternbrett (False, wenn schon gepostet)."""
+        if not await self.claim_star(message.id):
+            return False
 
-        # DB speichern
         try:
-            sql = "INSERT INTO stars (message_id) VALUES (?)"
-            val = (int(message.id),)
-            self.cursor.execute(sql, val)
-            self.db.commit()
-        except Exception as e:
-            log_event(
-                logger,
-                logging.ERROR,
-                self.__class__.__name__,
-                "db_insert_star_failed",
-                message.author,
-                message.author.id,
-                message_id=message.id,
-                error=e,
-                exc_info=True,
-            )
+            embed = await self.build_star_embed(message)
+            star_channel = self.bot.get_channel(POST_CHANNEL_ID)
+            star_message = await star_channel.send(embed=embed)
+        except Exception:
+            await self.release_star(message.id)
+            raise
+        await star_message.add_reaction("⭐")
 
         log_event(
             logger,
@@ -164,6 +222,7 @@ class Star(commands.Cog):
             message.author.id,
             message_id=message.id,
         )
+        return True
 
     # --- Event Listener ---
 
@@ -175,35 +234,67 @@ class Star(commands.Cog):
 
         if str(emoji) == "⭐" and int(channel_id) != POST_CHANNEL_ID:
             try:
-                cache_msg = discord.utils.get(
-                    self.bot.cached_messages, id=message_id)
-                if not cache_msg:
+                if message_id in self.posted_stars:
                     return
 
-                reactions = cache_msg.reactions
-                star_dict = {
-                    reaction.emoji: reaction.count for reaction in reactions
-                }
+                # Zähler: aus dem Cache übernehmen, sonst inkrementell hochzählen
+                cache_msg = discord.utils.get(
+                    self.bot.cached_messages, id=message_id)
+                if cache_msg:
+                    count = star_count(cache_msg)
+                    await self.set_star_count(message_id, channel_id, count)
+                else:
+                    count = await self.bump_star_count(message_id, channel_id, 1)
+
+                # Erst beim Erreichen des Thresholds einmal fetchen & echten Wert prüfen
+                if count >= THRESHOLD:
+                    message = cache_msg
+                    if message is None:
+                        # force: Reaktionszahlen müssen aktuell sein
+                        message = await self.bot.message_pool.fetch(
+                            channel_id, message_id, cog=self.__class__.__name__, force=True)
+                        if message is None:
+                            await self.db.execute(
+                                "DELETE FROM star_counts WHERE message_id=?", (message_id,))
+                            return
+                    real_count = star_count(message)
+                    if real_count >= THRESHOLD:
+                        if await self.post_star(message):
+                            await self.db.execute(
+                                "DELETE FROM star_counts WHERE message_id=?", (message_id,))
+                    else:
+                        await self.set_star_count(message_id, channel_id, real_count)
 
-                # Nur wenn genau unser Threshold erreicht ist
-                if star_dict.get("⭐", 0) == THRESHOLD:
-                    # DB check: wurde schon gepostet?
-                    self.cursor.row_factory = lambda cursor, row: row[0]
-                    posted_stars = self.cursor.execute(
-                        "SELECT message_id FROM stars"
-                    ).fetchall()
+            except Exception as e:
+                log_event(
+                    logger,
+                    logging.ERROR,
+                    self.__class__.__name__,
+                    "reaction_event_failed",
+                    user=None,
+                    user_id=user_id,
+                    message_id=message_id,
+                    error=e,
+                    exc_info=True,
+                )
 
-                    if message_id not in posted_stars:
-                        channel = self.bot.get_channel(channel_id)
-                        message = await channel.fetch_message(message_id)
-                        await self.post_star(message)
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: RawReactionActionEvent):
+        """Zählt entfernte ⭐-Reaktionen im Zähler herunter."""
+        message_id, channel_id, emoji, user_id = self.parse_raw_reaction_event(
+            payload)
 
+        if str(emoji) == "⭐" and int(channel_id) != POST_CHANNEL_ID:
+            if message_id in self.posted_stars:
+                return
+            try:
+                await self.bump_star_count(message_id, channel_id, -1)
             except Exception as e:
                 log_event(
                     logger,
                     logging.ERROR,
                     self.__class__.__name__,
-                    "reaction_event_failed",
+                    "reaction_remove_failed",
                     user=None,
                     user_id=user_id,
                     message_id=message_id,
@@ -260,14 +351,12 @@ class Star(commands.Cog):
                     link=link,
                 )
                 return
-            channel = self.bot.get_channel(channel_id)
-            message = await channel.fetch_message(msg_id)
-            # DB check
-            self.cursor.row_factory = lambda cursor, row: row[0]
-            posted_stars = self.cursor.execute(
-                "SELECT message_id FROM stars"
-            ).fetchall()
-            if msg_id in posted_stars:
+            message = await self.bot.message_pool.fetch(
+                channel_id, msg_id, cog=self.__class__.__name__)
+            if message is None:
+                await interaction.response.send_message("Nachricht nicht gefunden.", ephemeral=True)
+                return
+            if not await self.post_star(message):
                 await interaction.response.send_message("Die Nachricht ist schon im Sternbrett.", ephemeral=True)
                 log_event(
                     logger,
@@ -279,7 +368,6 @@ class Star(commands.Cog):
                     message_id=msg_id,
                 )
                 return
-            await self.post_star(message)
             await interaction.response.send_message("Star erfolgreich gepostet ✅", ephemeral=True)
             log_event(
                 logger,
@@ -15,9 +15,11 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+import os
+from collections import deque
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
@@ -25,6 +27,7 @@ import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
+from utils.async_cache import AsyncCache
 from utils.logging_helper import log_event
 
 logger = logging.getLogger("ZicklaaBotRewrite.Wiki")
@@ -34,38 +37,22 @@ logger = logging.getLogger("ZicklaaBotRewrite.Wiki")
 WIKI_LANGS: Tuple[str, ...] = ("de", "en")
 SEARCH_LIMIT_DEFAULT = 5
 AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_TTL = timedelta(minutes=30)
+AUTOCOMPLETE_CACHE_ENTRIES = 4096
+AUTOCOMPLETE_DEBOUNCE_SECONDS = 0.15  # erst nach dieser Tipp-Pause upstream suchen
 SUMMARY_TTL = timedelta(hours=2)
+SUMMARY_STALE_TTL = timedelta(hours=22)  # danach noch sofort ausliefern + im Hintergrund neu laden
+SUMMARY_CACHE_ENTRIES = 2048
+SUMMARY_CACHE_BYTES = 16 * 1024 * 1024
 
-WIKI_ICON = "https://upload.wikimedia.org/wikipedia/commons/6/63/Wikipedia-logo.png"
-
-
-# -------------------- Cache --------------------
-
-@dataclass
-class CacheEntry:
-    data: Dict[str, Any]
-    ts: datetime
-
-
-class TTLCache:
-    def __init__(self, ttl: timedelta):
-        self.ttl = ttl
-        self._d: Dict[Tuple[str, str], CacheEntry] = {}
-        self._lock = asyncio.Lock()
-
-    async def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
-        async with self._lock:
-            entry = self._d.get(key)
-            if not entry:
-                return None
-            if datetime.now(timezone.utc) - entry.ts > self.ttl:
-                self._d.pop(key, None)
-                return None
-            return entry.data
+# Zufallsartikel: vorgeladener Pool pro Sprache (+ optionaler Snapshot)
+RANDOM_POOL_SIZE = 20
+RANDOM_POOL_LOW_WATER = 8
+RANDOM_REFILL_DELAY_SECONDS = 0.5  # Abstand zwischen Refill-Requests
+RANDOM_REFILL_ERROR_SECONDS = 60
+RANDOM_POOL_SNAPSHOT = os.environ.get("WIKI_RANDOM_SNAPSHOT")  # Pfad, leer = aus
 
-    async def set(self, key: Tuple[str, str], data: Dict[str, Any]):
-        async with self._lock:
-            self._d[key] = CacheEntry(data=data, ts=datetime.now(timezone.utc))
+WIKI_ICON = "https://upload.wikimedia.org/wikipedia/commons/6/63/Wikipedia-logo.png"
 
 
 # -------------------- HTTP Client --------------------
@@ -243,18 +230,47 @@ class Wiki(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.session: Optional[aiohttp.ClientSession] = None
-        self.cache = TTLCache(SUMMARY_TTL)
+        self.cache = AsyncCache(
+            ttl=SUMMARY_TTL.total_seconds(),
+            stale_ttl=SUMMARY_STALE_TTL.total_seconds(),
+            max_entries=SUMMARY_CACHE_ENTRIES,
+            max_bytes=SUMMARY_CACHE_BYTES,
+        )
+        # Autocomplete: (lang, prefix) -> Treffer; laufende Eingabe pro User
+        self.title_cache = AsyncCache(
+            ttl=AUTOCOMPLETE_TTL.total_seconds(),
+            max_entries=AUTOCOMPLETE_CACHE_ENTRIES,
+        )
+        self._autocomplete_tasks: Dict[int, asyncio.Task] = {}
+        self._prefetch_tasks: set[asyncio.Task] = set()
+        # Zufallsartikel-Pool
+        self._random_pools: Dict[str, deque[Dict[str, Any]]] = {
+            lang: deque(maxlen=RANDOM_POOL_SIZE) for lang in WIKI_LANGS}
+        self._random_refill = asyncio.Event()
+        self._random_task: Optional[asyncio.Task] = None
 
     async def cog_load(self):
         self.session = aiohttp.ClientSession()
+        if RANDOM_POOL_SNAPSHOT:
+            await asyncio.to_thread(self._load_random_snapshot)
+        self._random_task = asyncio.create_task(self._random_refill_loop())
+        self._random_refill.set()
         log_event(
             logger,
             logging.INFO,
             self.__class__.__name__,
             "cog_loaded",
+            random_pool={lang: len(pool) for lang, pool in self._random_pools.items()},
         )
 
     async def cog_unload(self):
+        for task in self._prefetch_tasks:
+            task.cancel()
+        if self._random_task is not None:
+            self._random_task.cancel()
+            self._random_task = None
+        if RANDOM_POOL_SNAPSHOT:
+            await asyncio.to_thread(self._save_random_snapshot)
         if self.session and not self.session.closed:
             await self.session.close()
         log_event(
@@ -262,6 +278,8 @@ class Wiki(commands.Cog):
             logging.INFO,
             self.__class__.__name__,
             "cog_unloaded",
+            cache=self.cache.stats(),
+            title_cache=self.title_cache.stats(),
         )
 
     # --------- Cache-aware Helper ---------
@@ -269,16 +287,126 @@ class Wiki(commands.Cog):
     async def get_summary(self, lang: str, title: str, *, bypass_cache: bool = False) -> Dict[str, Any]:
         assert self.session is not None
         key = (lang, title.lower().strip())
-        if not bypass_cache:
-            cached = await self.cache.get(key)
-            if cached:
-                return cached
-        data = await wiki_summary(self.session, lang, title)
-        await self.cache.set(key, data)
-        return data
+        return await self.cache.get_or_fetch(
+            key, lambda: wiki_summary(self.session, lang, title), force=bypass_cache)
+
+    def prefetch_summaries(self, lang: str, titles: List[str]) -> None:
+        """
+        Lädt die Summaries aller Suchtreffer parallel im Hintergrund in den
+        Cache. Läuft ein Fetch noch, wenn der User im Dropdown wählt, hängt
+        sich ``get_summary`` per Coalescing einfach dran.
+        """
+        async def run():
+            results = await asyncio.gather(
+                *(self.get_summary(lang, title) for title in titles),
+                return_exceptions=True,
+            )
+            failed = [t for t, r in zip(titles, results) if isinstance(r, Exception)]
+            if failed:
+                log_event(
+                    logger,
+                    logging.WARNING,
+                    self.__class__.__name__,
+                    "prefetch_partial",
+                    lang=lang,
+                    failed=failed,
+                )
+
+        task = asyncio.create_task(run())
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    # --------- Zufallsartikel-Pool ---------
+
+    async def random_summary(self, lang: str) -> Dict[str, Any]:
+        """Zufallsartikel aus dem Pool (sofort) – nur wenn er leer ist, live."""
+        pool = self._random_pools[lang]
+        if len(pool) <= RANDOM_POOL_LOW_WATER:
+            self._random_refill.set()
+        if pool:
+            return pool.popleft()
+        assert self.session is not None
+        return await wiki_random_summary(self.session, lang)
+
+    async def _random_refill_loop(self):
+        while True:
+            await self._random_refill.wait()
+            self._random_refill.clear()
+            for lang, pool in self._random_pools.items():
+                while len(pool) < RANDOM_POOL_SIZE:
+                    try:
+                        pool.append(await wiki_random_summary(self.session, lang))
+                    except Exception as e:
+                        log_event(
+                            logger,
+                            logging.WARNING,
+                            self.__class__.__name__,
+                            "random_refill_failed",
+                            lang=lang,
+                            error=e,
+                        )
+                        await asyncio.sleep(RANDOM_REFILL_ERROR_SECONDS)
+                        self._random_refill.set()
+                        break
+                    await asyncio.sleep(RANDOM_REFILL_DELAY_SECONDS)
+            if RANDOM_POOL_SNAPSHOT:
+                await asyncio.to_thread(self._save_random_snapshot)
+
+    def _load_random_snapshot(self):
+        try:
+            with open(RANDOM_POOL_SNAPSHOT, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        for lang, pool in self._random_pools.items():
+            pool.extend(snapshot.get(lang, [])[:RANDOM_POOL_SIZE])
+
+    def _save_random_snapshot(self):
+        snapshot = {lang: list(pool) for lang, pool in self._random_pools.items()}
+        tmp_path = f"{RANDOM_POOL_SNAPSHOT}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, RANDOM_POOL_SNAPSHOT)
 
     # --------- Autocomplete ---------
 
+    def _titles_from_prefix(self, lang: str, prefix: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Leitet Treffer aus dem längsten gecachten kürzeren Prefix ab – nur
+        wenn dessen Liste vollständig war (weniger als AUTOCOMPLETE_LIMIT
+        Treffer); dann ist jeder Treffer für ``prefix`` darin enthalten.
+        """
+        for end in range(len(prefix) - 1, 0, -1):
+            pages = self.title_cache.peek((lang, prefix[:end]))
+            if pages is not None and len(pages) < AUTOCOMPLETE_LIMIT:
+                return [
+                    p for p in pages
+                    if any(
+                        (p.get(field) or "").casefold().startswith(prefix)
+                        for field in ("title", "matched_title")
+                    )
+                ]
+        return None
+
+    async def search_titles_cached(self, lang: str, query: str) -> List[Dict[str, Any]]:
+        """Titelsuche fürs Autocomplete: Cache → Prefix-Ableitung → (entprellt) API."""
+        assert self.session is not None
+        prefix = " ".join(query.casefold().split())
+        key = (lang, prefix)
+
+        pages = self.title_cache.get(key)
+        if pages is not None:
+            return pages
+        pages = self._titles_from_prefix(lang, prefix)
+        if pages is not None:
+            self.title_cache.set(key, pages)
+            return pages
+
+        # Tippt der User weiter, wird dieser Task hier abgebrochen (s. u.)
+        await asyncio.sleep(AUTOCOMPLETE_DEBOUNCE_SECONDS)
+        return await self.title_cache.get_or_fetch(
+            key, lambda: wiki_search_titles(self.session, lang, query, limit=AUTOCOMPLETE_LIMIT))
+
     async def title_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
         try:
             lang = "de"
@@ -291,8 +419,18 @@ class Wiki(commands.Cog):
             if not current:
                 return []
 
-            assert self.session is not None
-            pages = await wiki_search_titles(self.session, lang, current, limit=AUTOCOMPLETE_LIMIT)
+            # Neuer Tastendruck → veralteten Autocomplete-Task desselben Users
+            # abbrechen; discord.py schickt für den dann keine Antwort mehr
+            task = asyncio.current_task()
+            previous = self._autocomplete_tasks.get(interaction.user.id)
+            if previous is not None and previous is not task and not previous.done():
+                previous.cancel()
+            self._autocomplete_tasks[interaction.user.id] = task
+            try:
+                pages = await self.search_titles_cached(lang, current)
+            finally:
+                if self._autocomplete_tasks.get(interaction.user.id) is task:
+                    del self._autocomplete_tasks[interaction.user.id]
             choices: List[app_commands.Choice[str]] = []
             for p in pages:
                 title = p.get("title") or p.get("key")
@@ -353,6 +491,10 @@ class Wiki(commands.Cog):
                 await interaction.followup.send("😕 Konnte den ersten Treffer nicht lesen.", ephemeral=True)
                 return
 
+            # Alle Treffer parallel vorladen; der erste wird direkt gebraucht
+            # und teilt sich den laufenden Fetch
+            self.prefetch_summaries(
+                lang, [t for t in (r.get("title") or r.get("key") for r in results[:25]) if t])
             data = await self.get_summary(lang, first_title)
             embed = build_summary_embed(data, lang)
             view = SearchResultsView(self, lang, results, data)
@@ -436,10 +578,9 @@ class Wiki(commands.Cog):
 
         await interaction.response.defer(thinking=True)
         try:
-            assert self.session is not None
-            data = await wiki_random_summary(self.session, lang)
+            data = await self.random_summary(lang)
             title = data.get("title", "?")
-            await self.cache.set((lang, title.lower()), data)
+            self.cache.set((lang, title.lower()), data)
             embed = build_summary_embed(data, lang)
             view = SearchResultsView(
                 self, lang, [{"title": title, "description": data.get("description", "")}], data)
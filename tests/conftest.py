@@ -0,0 +1,18 @@
+import copy
+import json
+import os
+import sys
+
+import pytest
+
+# Tests importieren utils/commands direkt aus dem Repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+@pytest.fixture
+def bl1_matches() -> list[dict]:
+    """Gekürzte /competitions/BL1/matches-Antwort (frische Kopie pro Test)."""
+    with open(os.path.join(FIXTURES, "bl1_matches.json"), encoding="utf-8") as f:
+        return copy.deepcopy(json.load(f)["matches"])
@@ -0,0 +1,172 @@
+import asyncio
+import copy
+from datetime import timedelta
+
+import pytest
+
+from commands import buli
+from commands.buli import Buli, score_changes
+
+LIVE_ID = 537005  # SGE – FCB, IN_PLAY 0:1
+LATER_ID = 537006  # SCF – BVB, TIMED
+
+
+class ScriptedClient:
+    """Spielt pro Matches-Request den nächsten Snapshot ab (Standings leer)."""
+
+    def __init__(self, snapshots: list[list[dict]]):
+        self.snapshots = list(snapshots)
+
+    async def get(self, path: str, params: dict | None = None) -> dict:
+        if path.endswith("/standings"):
+            return {"standings": []}
+        matches = copy.deepcopy(self.snapshots.pop(0))
+        if params and "matchday" in params:
+            matches = [m for m in matches if m["matchday"] == params["matchday"]]
+        return {"matches": matches}
+
+
+def snapshot(base: list[dict], **changes: dict) -> list[dict]:
+    """Kopie von ``base`` mit geänderten Spielen: ``m537005={"score": (1, 1)}``."""
+    matches = copy.deepcopy(base)
+    for m in matches:
+        change = changes.get(f"m{m['id']}", {})
+        if "score" in change:
+            home, away = change["score"]
+            m["score"]["fullTime"] = {"home": home, "away": away}
+        if "status" in change:
+            m["status"] = change["status"]
+    return matches
+
+
+@pytest.fixture(autouse=True)
+def short_coalesce(monkeypatch):
+    monkeypatch.setattr(buli, "GOAL_COALESCE_SECONDS", 0.05)
+    monkeypatch.setenv("FOOTBALL_DATA_API_TOKEN", "token")
+
+
+def make_cog(snapshots: list[list[dict]], subscribers=(1, 2)) -> tuple[Buli, list[tuple[int, str]]]:
+    """Cog mit geskriptetem Client; ``_send_goal`` protokolliert statt zu senden."""
+    cog = Buli(bot=None, db=None)
+    cog.client = ScriptedClient(snapshots)
+    cog.subscribers = set(subscribers)
+    sent: list[tuple[int, str]] = []
+
+    async def send_goal(channel_id, content):
+        sent.append((channel_id, content))
+
+    cog._send_goal = send_goal
+    return cog, sent
+
+
+def run_polls(snapshots: list[list[dict]], *, subscribers=(1, 2), gap: timedelta | None = None):
+    """Lässt den Cog die Snapshots pollen und gibt die gesendeten Nachrichten zurück."""
+
+    async def scenario():
+        cog, sent = make_cog(snapshots, subscribers)
+        for _ in snapshots:
+            if gap is not None and cog._snapshot_at is not None:
+                cog._snapshot_at -= gap
+            await cog._refresh_snapshot()
+        if cog._goal_task is not None:
+            await cog._goal_task
+        return sent
+
+    return asyncio.run(scenario())
+
+
+def test_score_changes_filters_updates(bl1_matches):
+    live = next(m for m in bl1_matches if m["id"] == LIVE_ID)
+    later = next(m for m in bl1_matches if m["id"] == LATER_ID)
+    scored = snapshot([live], m537005={"score": (1, 1)})[0]
+    finished = snapshot([live], m537005={"score": (1, 2), "status": "FINISHED"})[0]
+    paused = snapshot([live], m537005={"status": "PAUSED"})[0]
+    rescheduled = snapshot([later], m537006={"score": (0, 0)})[0]
+
+    updates = [
+        (None, scored),  # neues Spiel (erster Load) zählt nicht
+        (live, scored),
+        (live, finished),
+        (live, paused),  # nur Status
+        (later, rescheduled),  # nicht live
+    ]
+    assert score_changes(updates) == [(live, scored), (live, finished)]
+
+
+def test_first_load_sends_nothing(bl1_matches):
+    assert run_polls([bl1_matches]) == []
+
+
+def test_goals_in_window_are_coalesced(bl1_matches):
+    sent = run_polls([
+        bl1_matches,
+        snapshot(bl1_matches, m537005={"score": (1, 1)}),
+        snapshot(bl1_matches, m537005={"score": (2, 1)}),
+    ])
+
+    # eine Nachricht pro Channel, nur der letzte Stand
+    assert sorted(cid for cid, _ in sent) == [1, 2]
+    assert sent[0][1] == sent[1][1]
+    assert sent[0][1].count("\n") == 1
+    assert "`2:1`" in sent[0][1]
+
+
+def test_goals_of_several_matches_share_one_message(bl1_matches):
+    bl1_matches[5]["status"] = "IN_PLAY"
+    sent = run_polls([
+        bl1_matches,
+        snapshot(bl1_matches, m537005={"score": (1, 1)}, m537006={"score": (1, 0)}),
+    ], subscribers=(1,))
+
+    [(_, content)] = sent
+    assert content.splitlines()[1:] == [
+        "**Frankfurt** `1:1` **Bayern** 🔴 LIVE",
+        "**Freiburg** `1:0` **Dortmund** 🔴 LIVE",
+    ]
+
+
+def test_var_reversal_within_window_is_dropped(bl1_matches):
+    sent = run_polls([
+        bl1_matches,
+        snapshot(bl1_matches, m537005={"score": (1, 1)}),
+        snapshot(bl1_matches, m537005={"score": (0, 1)}),  # Tor zurückgenommen
+    ])
+    assert sent == []
+
+
+def test_stale_snapshot_reports_no_goals(bl1_matches):
+    sent = run_polls([
+        bl1_matches,
+        snapshot(bl1_matches, m537005={"score": (1, 1)}),
+    ], gap=buli.GOAL_MAX_GAP + timedelta(minutes=1))
+    assert sent == []
+
+
+def test_goal_queued_during_slow_send_is_flushed(bl1_matches):
+    async def scenario():
+        cog, sent = make_cog([
+            bl1_matches,
+            snapshot(bl1_matches, m537005={"score": (1, 1)}),
+            snapshot(bl1_matches, m537005={"score": (2, 1)}),
+        ], subscribers=(1,))
+        sending, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_send(channel_id, content):
+            sending.set()
+            await release.wait()
+            sent.append((channel_id, content))
+
+        cog._send_goal = slow_send
+        await cog._refresh_snapshot()
+        await cog._refresh_snapshot()
+        await asyncio.wait_for(sending.wait(), 1)
+
+        await cog._refresh_snapshot()  # Tor, während die erste Meldung noch rausgeht
+        release.set()
+        await asyncio.wait_for(cog._goal_task, 1)
+        return sent, cog._pending_goals
+
+    sent, pending = asyncio.run(scenario())
+    assert ["`1:1`" in content for _, content in sent] == [True, False]
+    assert "`2:1`" in sent[1][1]
+    assert pending == {}
@@ -0,0 +1,97 @@
+import gzip
+import json
+import sqlite3
+
+import pytest
+
+from utils.db_export import export_file, import_file
+
+FAVS_DDL = """
+    CREATE TABLE favs(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        message_id INTEGER,
+        name TEXT,
+        channel_id INTEGER,
+        excerpt TEXT,
+        gone INTEGER NOT NULL DEFAULT 0
+    )
+"""
+ROWS = [
+    (1, 10, 100, "katze", 5, None, 0),
+    (2, 10, 101, "\\N", 5, "\\N ist kein NULL", 0),
+    (3, 11, 102, "\\\\doppelt", 6, "C:\\pfad", 1),
+    (4, 11, 103, "komma, \"quote\"\nzeile", 6, "", 0),
+]
+
+
+def make_db(path, rows=ROWS) -> str:
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(FAVS_DDL)
+        conn.executemany("INSERT INTO favs VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.close()
+    return str(path)
+
+
+def read_rows(db_path) -> list[tuple]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT * FROM favs ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("filename", ["favs.ndjson", "favs.ndjson.gz", "favs.csv", "favs.csv.gz"])
+def test_round_trip_keeps_nulls_and_backslashes(tmp_path, filename):
+    source = make_db(tmp_path / "source.db")
+    target = make_db(tmp_path / "target.db", rows=[])
+    path = str(tmp_path / filename)
+
+    assert export_file(source, "favs", path) == len(ROWS)
+    assert import_file(target, "favs", path) == len(ROWS)
+    assert read_rows(target) == ROWS
+
+
+def test_import_skips_or_replaces_existing_ids(tmp_path):
+    source = make_db(tmp_path / "source.db")
+    target = make_db(tmp_path / "target.db", rows=[(1, 99, 999, "alt", 9, None, 0)])
+    path = str(tmp_path / "favs.csv.gz")
+    export_file(source, "favs", path)
+
+    import_file(target, "favs", path)
+    assert read_rows(target)[0] == (1, 99, 999, "alt", 9, None, 0)
+    import_file(target, "favs", path, replace=True)
+    assert read_rows(target) == ROWS
+
+
+def test_partial_columns_use_table_defaults(tmp_path):
+    target = make_db(tmp_path / "target.db", rows=[])
+    path = tmp_path / "favs.ndjson"
+    path.write_text(json.dumps({"id": 7, "user_id": 1, "name": "neu"}) + "\n", encoding="utf-8")
+
+    assert import_file(target, "favs", str(path)) == 1
+    assert read_rows(target) == [(7, 1, None, "neu", None, None, 0)]
+
+
+def test_failed_import_changes_nothing(tmp_path):
+    target = make_db(tmp_path / "target.db", rows=ROWS[:1])
+    path = tmp_path / "favs.ndjson.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"id": 5, "name": "ok"}) + "\n")
+        f.write('{"id": 6, "name": \n')  # abgeschnittene Datei
+
+    with pytest.raises(json.JSONDecodeError):
+        import_file(target, "favs", str(path))
+    assert read_rows(target) == ROWS[:1]
+
+
+def test_unknown_table_and_columns_are_rejected(tmp_path):
+    target = make_db(tmp_path / "target.db", rows=[])
+    path = tmp_path / "favs.ndjson"
+    path.write_text(json.dumps({"id": 1, "bogus": 2}) + "\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="bogus"):
+        import_file(target, "favs", str(path))
+    with pytest.raises(ValueError, match="Unbekannte Tabelle"):
+        import_file(target, "favs; DROP TABLE favs", str(path))
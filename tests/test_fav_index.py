@@ -0,0 +1,74 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from utils.fav_index import FavIdIndex, FavNameIndex
+
+DRAWS_PER_ID = 200
+
+
+def chi2_critical(df: int, z: float = 3.09) -> float:
+    """Wilson-Hilferty-Näherung des Chi²-Quantils (z=3.09 → p=0.999)."""
+    k = 2 / (9 * df)
+    return df * (1 - k + z * math.sqrt(k)) ** 3
+
+
+@pytest.fixture
+def gappy_index():
+    """Index mit lückenhaften IDs, danach per Swap-Remove ausgedünnt."""
+    rng = random.Random(1234)
+    ids = sorted(rng.sample(range(1, 50_000), 400))
+    index = FavIdIndex()
+    index.load((fav_id, rng.choice((1, 2, 3)), rng.choice((10, 20))) for fav_id in ids)
+    for fav_id in rng.sample(ids, 100):
+        index.remove(fav_id)
+    return index
+
+
+def expected_ids(index: FavIdIndex, user_id=None, channel_id=None) -> set[int]:
+    return {
+        fav_id for fav_id, (u, c) in index._owner.items()
+        if user_id in (None, u) and channel_id in (None, c)
+    }
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"user_id": 2},
+    {"channel_id": 20},
+    {"user_id": 3, "channel_id": 10},
+])
+def test_pick_is_uniform(gappy_index, filters):
+    random.seed(42)
+    expected = expected_ids(gappy_index, **filters)
+    assert len(expected) > 20
+    draws = DRAWS_PER_ID * len(expected)
+    counts = Counter(gappy_index.pick(**filters) for _ in range(draws))
+
+    assert set(counts) == expected  # nur passende IDs, keine gelöschten
+    chi2 = sum((counts[i] - DRAWS_PER_ID) ** 2 / DRAWS_PER_ID for i in expected)
+    assert chi2 < chi2_critical(len(expected) - 1)
+
+
+def test_pick_empty_and_unknown():
+    index = FavIdIndex()
+    assert index.pick() is None
+    index.add(5, user_id=1, channel_id=10)
+    assert index.pick(user_id=2) is None
+    assert index.pick(user_id=1, channel_id=20) is None
+    index.remove(5)
+    assert index.pick(user_id=1) is None
+    assert len(index) == 0
+
+
+def test_name_index_find_and_complete():
+    names = FavNameIndex()
+    names.load([(1, 7, "Katze"), (2, 7, "katzenbild"), (3, 8, "Katze")])
+    assert names.find(7, "KATZE") == [1]
+    assert names.complete(7, "katz") == ["Katze", "katzenbild"]
+    names.remove(1)
+    # exakter Treffer weg → Fuzzy-Suche findet den ähnlichsten Namen
+    assert names.find(7, "katze") == [2]
+    assert names.complete(7, "k") == ["katzenbild"]
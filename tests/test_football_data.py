@@ -0,0 +1,129 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utils import football_data
+from utils.football_data import FootballDataClient, FootballDataError
+from utils.storage import Storage
+
+PATH = "/competitions/BL1/matches"
+PAYLOAD = {"matches": [{"id": 1, "matchday": 1}]}
+
+HTTP_CACHE_DDL = """
+    CREATE TABLE IF NOT EXISTS http_cache(
+        key TEXT PRIMARY KEY,
+        etag TEXT,
+        last_modified TEXT,
+        fetched_at REAL,
+        expires_at REAL,
+        body TEXT
+    )
+"""
+
+
+class FakeFootballData:
+    """Lokaler football-data-Server, der eine Liste von Antworten abspielt."""
+
+    def __init__(self, *responses: web.Response):
+        self.responses = list(responses)
+        self.requests: list[tuple[float, dict]] = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append((time.monotonic(), dict(request.headers)))
+        return self.responses.pop(0)
+
+    async def run(self, scenario, db=None):
+        app = web.Application()
+        app.router.add_get(PATH, self.handle)
+        server = TestServer(app)
+        await server.start_server()
+        client = FootballDataClient("token", base=str(server.make_url("")).rstrip("/"), db=db)
+        try:
+            return await scenario(client)
+        finally:
+            await client.close()
+            await server.close()
+
+
+def ok(**headers) -> web.Response:
+    return web.json_response(PAYLOAD, headers=headers)
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(football_data, "BACKOFF_BASE_SECONDS", 0.01)
+
+
+def test_429_waits_for_reset_then_succeeds():
+    fake = FakeFootballData(
+        web.Response(status=429, headers={"X-RequestCounter-Reset": "1"}),
+        ok(**{"X-Requests-Available-Minute": "9"}),
+    )
+    data = asyncio.run(fake.run(lambda client: client.get(PATH)))
+
+    assert data == PAYLOAD
+    (first, _), (second, _) = fake.requests
+    assert second - first >= 0.9  # bis zum Reset gewartet, nicht per Backoff
+
+
+def test_5xx_is_retried():
+    fake = FakeFootballData(web.Response(status=503), web.Response(status=502), ok())
+    assert asyncio.run(fake.run(lambda client: client.get(PATH))) == PAYLOAD
+    assert len(fake.requests) == 3
+
+
+def test_5xx_gives_up_after_max_retries():
+    fake = FakeFootballData(*(web.Response(status=500) for _ in range(football_data.MAX_RETRIES + 1)))
+    with pytest.raises(FootballDataError) as exc:
+        asyncio.run(fake.run(lambda client: client.get(PATH)))
+    assert exc.value.status == 500
+    assert len(fake.requests) == football_data.MAX_RETRIES + 1
+
+
+def test_404_fails_fast():
+    fake = FakeFootballData(web.Response(status=404, text="not found"), ok())
+    with pytest.raises(FootballDataError) as exc:
+        asyncio.run(fake.run(lambda client: client.get(PATH)))
+    assert exc.value.status == 404
+    assert len(fake.requests) == 1
+
+
+def test_304_with_etag_serves_stored_body(tmp_path):
+    async def scenario(client):
+        await db.execute(HTTP_CACHE_DDL)
+        first = await client.get(PATH)
+        _, _, fetched_at, _, _ = await client._load_entry(PATH)
+        second = await client.get(PATH)
+        entry = await client._load_entry(PATH)
+        return first, second, fetched_at, entry
+
+    db = Storage(str(tmp_path / "cache.db"))
+    fake = FakeFootballData(ok(ETag='"v1"'), web.Response(status=304, headers={"ETag": '"v1"'}))
+    try:
+        first, second, fetched_at, entry = asyncio.run(fake.run(scenario, db=db))
+    finally:
+        asyncio.run(db.close())
+
+    assert first == second == PAYLOAD
+    assert "If-None-Match" not in fake.requests[0][1]
+    assert fake.requests[1][1]["If-None-Match"] == '"v1"'
+    assert entry[0] == '"v1"'
+    assert entry[2] >= fetched_at  # nur Metadaten aufgefrischt
+
+
+def test_fresh_cache_entry_skips_network(tmp_path):
+    async def scenario(client):
+        await db.execute(HTTP_CACHE_DDL)
+        await client.get(PATH)
+        return await client.get(PATH)
+
+    db = Storage(str(tmp_path / "cache.db"))
+    fake = FakeFootballData(ok(**{"Cache-Control": "max-age=60"}))
+    try:
+        assert asyncio.run(fake.run(scenario, db=db)) == PAYLOAD
+    finally:
+        asyncio.run(db.close())
+    assert len(fake.requests) == 1
@@ -0,0 +1,87 @@
+import asyncio
+from types import SimpleNamespace
+
+from utils.reminder_scheduler import ReminderScheduler
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def reminder(time: float, id: int | None = None):
+    return SimpleNamespace(time=time, _id=id)
+
+
+def make_scheduler(clock: FakeClock):
+    batches: list[list] = []
+    delivered = asyncio.Event()
+
+    async def callback(due):
+        batches.append(due)
+        delivered.set()
+
+    return ReminderScheduler(callback, clock=clock), batches, delivered
+
+
+def test_push_wakes_sleeping_scheduler_early():
+    async def scenario():
+        clock = FakeClock()
+        scheduler, batches, delivered = make_scheduler(clock)
+        # nächster Reminder erst in einer Stunde → Scheduler schläft (gedeckelt) 300 s
+        scheduler.load([reminder(clock.now + 3600, 1)])
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        assert batches == []
+
+        scheduler.push(reminder(clock.now, 2))  # neue Spitze, sofort fällig
+        await asyncio.wait_for(delivered.wait(), 1)
+        scheduler.stop()
+        return batches, scheduler
+
+    batches, scheduler = asyncio.run(scenario())
+    assert [[r._id for r in batch] for batch in batches] == [[2]]
+    assert scheduler.next_time() == 1000.0 + 3600
+
+
+def test_due_reminders_drain_in_one_pass():
+    async def scenario():
+        clock = FakeClock()
+        scheduler, batches, delivered = make_scheduler(clock)
+        for i, offset in enumerate((30, -10, 0, -20, 60)):
+            scheduler.push(reminder(clock.now + offset, i))
+        scheduler.start()
+        await asyncio.wait_for(delivered.wait(), 1)
+        scheduler.stop()
+        return batches, scheduler
+
+    batches, scheduler = asyncio.run(scenario())
+    # genau ein Callback, zeitlich sortiert, Zukünftiges bleibt liegen
+    assert [[r._id for r in batch] for batch in batches] == [[3, 1, 2]]
+    assert len(scheduler) == 2
+
+
+def test_pop_due_uses_clock():
+    clock = FakeClock()
+    scheduler, _, _ = make_scheduler(clock)
+    scheduler.load([reminder(1010, 1), reminder(1020, 2)])
+    assert scheduler.pop_due() == []
+    clock.now = 1015
+    assert [r._id for r in scheduler.pop_due()] == [1]
+    assert [r._id for r in scheduler.pop_due(now=2000)] == [2]
+
+
+def test_load_keeps_pushed_reminders_and_dedupes_by_id():
+    clock = FakeClock()
+    scheduler, _, _ = make_scheduler(clock)
+    # push während der DB-Abfrage in check_reminder …
+    scheduler.push(reminder(1500, 7))
+    # … dieselbe Zeile kommt auch aus der DB zurück
+    scheduler.load([reminder(1200, 5), reminder(1500, 7), reminder(1300, None)])
+    scheduler.load([reminder(1200, 5)])
+
+    assert len(scheduler) == 3
+    assert [r._id for r in scheduler.pop_due(now=2000)] == [5, None, 7]
@@ -0,0 +1,91 @@
+import copy
+
+from commands.buli import SeasonCache
+
+
+def by_id(matches: list[dict]) -> dict[int, dict]:
+    return {m["id"]: m for m in matches}
+
+
+def loaded(matches: list[dict]) -> SeasonCache:
+    season = SeasonCache()
+    assert season.apply(copy.deepcopy(matches)) == {1, 2, 3}
+    return season
+
+
+def test_initial_load(bl1_matches):
+    season = loaded(bl1_matches)
+    assert season.ready
+    assert (season.md_min, season.md_max, season.next_matchday) == (1, 3, 3)
+    assert [m["id"] for m in season.matchdays[1]] == [537001, 537002]
+    assert season.date_ranges[1] == "22.08.2025 – 23.08.2025"
+    assert all(old is None for old, _ in season.updates)
+
+
+def test_unchanged_payload_is_a_noop(bl1_matches):
+    season = loaded(bl1_matches)
+    version, md_versions = season.version, dict(season.md_versions)
+    rendered = season.matchdays[1]
+
+    assert season.apply(copy.deepcopy(bl1_matches)) == set()
+    assert season.updates == []
+    assert season.version == version
+    assert season.md_versions == md_versions
+    assert season.matchdays[1] is rendered  # nicht neu sortiert
+
+
+def test_score_change_touches_only_its_matchday(bl1_matches):
+    season = loaded(bl1_matches)
+    md_versions = dict(season.md_versions)
+    by_id(bl1_matches)[537005]["score"]["fullTime"] = {"home": 1, "away": 1}
+
+    assert season.apply(bl1_matches) == {3}
+    [(old, new)] = season.updates
+    assert old["score"]["fullTime"] == {"home": 0, "away": 1}
+    assert new["score"]["fullTime"] == {"home": 1, "away": 1}
+    assert season.md_versions[3] == season.version
+    assert season.md_versions[1] == md_versions[1]
+    assert season.md_versions[2] == md_versions[2]
+
+
+def test_partial_apply_keeps_missing_matches(bl1_matches):
+    season = loaded(bl1_matches)
+    live = [m for m in bl1_matches if m["matchday"] == 3]
+    live[0]["status"] = "PAUSED"
+
+    assert season.apply(live, full=False) == {3}
+    assert len(season.by_id) == len(bl1_matches)
+    assert set(season.matchdays) == {1, 2, 3}
+    assert season.by_id[537005]["status"] == "PAUSED"
+
+
+def test_fixture_moved_between_matchdays(bl1_matches):
+    season = loaded(bl1_matches)
+    moved = by_id(bl1_matches)[537004]
+    moved["matchday"] = 3
+    moved["utcDate"] = "2025-09-12T18:30:00Z"
+
+    assert season.apply(bl1_matches) == {2, 3}
+    assert [m["id"] for m in season.matchdays[2]] == [537003]
+    # nach Anstoß sortiert: verlegtes Spiel zuerst
+    assert [m["id"] for m in season.matchdays[3]] == [537004, 537005, 537006]
+    assert season.date_ranges[2] == "30.08.2025"
+
+
+def test_removed_fixture(bl1_matches):
+    season = loaded(bl1_matches)
+    remaining = [m for m in bl1_matches if m["id"] != 537002]
+
+    assert season.apply(remaining) == {1}
+    assert 537002 not in season.by_id
+    assert [m["id"] for m in season.matchdays[1]] == [537001]
+
+
+def test_removing_last_fixture_drops_matchday(bl1_matches):
+    season = loaded(bl1_matches)
+    remaining = [m for m in bl1_matches if m["matchday"] != 1]
+
+    assert season.apply(remaining) == {1}
+    assert 1 not in season.matchdays
+    assert 1 not in season.date_ranges
+    assert (season.md_min, season.md_max) == (2, 3)
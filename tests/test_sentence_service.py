@@ -0,0 +1,61 @@
+import asyncio
+
+from utils.model_registry import ModelRegistry
+from utils.sentence_service import SentenceService
+
+
+class FakeModel:
+    def __init__(self):
+        self.broken = False
+        self.calls = 0
+
+    def make_sentence(self, max_overlap_ratio):
+        self.calls += 1
+        return None if self.broken else f"satz {self.calls}"
+
+
+async def wait_until(predicate, timeout=2.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_pool_is_served_and_refilled():
+    async def scenario():
+        service = SentenceService(ModelRegistry(FakeModel), pool_size=3)
+        service.start()
+        try:
+            assert (await service.make_sentence(0.6)).startswith("satz")  # Pool entsteht: Miss
+            await wait_until(lambda: len(service._pools[0.6]) == 3)
+            assert (await service.make_sentence(0.6)).startswith("satz")
+            return service.stats()
+        finally:
+            service.close()
+
+    stats = asyncio.run(scenario())
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_empty_pool_refills_after_failed_refill():
+    async def scenario():
+        model = FakeModel()
+        model.broken = True
+        service = SentenceService(ModelRegistry(lambda: model), pool_size=3)
+        service.start()
+        try:
+            assert await service.make_sentence(0.6, attempts=1) == "Mir fällt grad nix ein 🤷"
+            # Refill scheitert am Budget und gibt auf → Pool bleibt leer
+            await wait_until(lambda: service.refills >= 1 and not service._refill_needed.is_set())
+            assert len(service._pools[0.6]) == 0
+
+            model.broken = False
+            await service.make_sentence(0.6)  # Miss auf leerem Pool stößt Refill erneut an
+            await wait_until(lambda: len(service._pools[0.6]) == 3)
+            await service.make_sentence(0.6)
+            return service.stats()
+        finally:
+            service.close()
+
+    stats = asyncio.run(scenario())
+    assert (stats["hits"], stats["misses"]) == (1, 2)
@@ -0,0 +1,213 @@
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+def approx_size(value: Any, _depth: int = 0) -> int:
+    """Grobe Speichergröße in Bytes (rekursiv für dict/list/tuple/set, max. 4 Ebenen)."""
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        size += sum(approx_size(k, _depth + 1) + approx_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(v, _depth + 1) for v in value)
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: Optional[float]  # None = läuft nicht ab
+    stale_until: Optional[float]
+    size: int
+
+
+class AsyncCache:
+    """Größenbegrenzter TTL/LRU-Cache für Cogs, mit Request-Coalescing.
+
+    - LRU-Eviction nach ``max_entries`` und optional ``max_bytes``
+      (Größe über ``sizeof``, Standard ``approx_size``),
+    - TTL pro Eintrag (Standard ``ttl``; ``None`` = kein Ablauf),
+    - ``get_or_fetch``: gleichzeitige Misses auf denselben Key teilen sich
+      EINEN Fetch; bricht ein Aufrufer ab, läuft der Fetch für die anderen
+      weiter,
+    - stale-while-revalidate: Abgelaufene Einträge werden noch ``stale_ttl``
+      Sekunden sofort ausgeliefert und im Hintergrund neu geladen,
+    - Zähler für Hits, Misses, Stale-Hits, Coalescing und Evictions.
+
+    Alles läuft auf dem Event-Loop, daher ohne Lock.
+
+    Args:
+        ttl: Standard-Lebensdauer in Sekunden (``None`` = unbegrenzt).
+        max_entries: Maximale Anzahl Einträge.
+        max_bytes: Optionales Limit der geschätzten Gesamtgröße.
+        stale_ttl: Wie lange abgelaufene Einträge noch ausgeliefert werden.
+        sizeof: Größenfunktion für ``max_bytes``.
+        clock: Zeitquelle, für Tests austauschbar.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float],
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        stale_ttl: float = 0.0,
+        sizeof: Callable[[Any], int] = approx_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.bytes = 0
+
+        # Metriken
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key) is not None
+
+    # -------------------- Synchrone API --------------------
+
+    def peek(self, key: Hashable) -> Any:
+        """Frischer Wert oder ``None`` – ohne Zähler, ohne LRU-Update."""
+        entry = self._entries.get(key)
+        if entry is None or self._expired(entry):
+            return None
+        return entry.value
+
+    def get(self, key: Hashable) -> Any:
+        """Frischer Wert (zählt Hit/Miss, markiert als zuletzt benutzt) oder ``None``."""
+        entry = self._entries.get(key)
+        if entry is None or self._expired(entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, *, ttl: Optional[float] = ...) -> None:
+        """Speichert ``value``; ``ttl`` überschreibt die Standard-Lebensdauer."""
+        ttl = self.ttl if ttl is ... else ttl
+        now = self._clock()
+        expires_at = None if ttl is None else now + ttl
+        stale_until = None if expires_at is None else expires_at + self.stale_ttl
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old.size
+        self._entries[key] = _Entry(value, expires_at, stale_until, size)
+        self.bytes += size
+        self._evict()
+
+    def inflight(self, key: Hashable) -> bool:
+        """Läuft für ``key`` gerade ein Fetch?"""
+        return key in self._inflight
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    # -------------------- Async API --------------------
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        *,
+        ttl: Optional[float] = ...,
+        force: bool = False,
+    ) -> Any:
+        """
+        Wert aus dem Cache oder über ``fetch`` laden. ``force`` ignoriert den
+        Cache (z. B. Refresh-Button), coalesct aber trotzdem.
+        """
+        if not force:
+            entry = self._entries.get(key)
+            if entry is not None:
+                now = self._clock()
+                if not self._expired(entry, now):
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return entry.value
+                if entry.stale_until is not None and now < entry.stale_until:
+                    self.stale_hits += 1
+                    self._entries.move_to_end(key)
+                    self._start_fetch(key, fetch, ttl)
+                    return entry.value
+
+        if key in self._inflight:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+        task = self._start_fetch(key, fetch, ttl)
+        # shield: ein abgebrochener Aufrufer bricht den Fetch nicht für alle ab
+        return await asyncio.shield(task)
+
+    def _start_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, fetch, ttl))
+            self._inflight[key] = task
+            # Fehler eines reinen Hintergrund-Refreshs nicht als "never retrieved" loggen
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float]) -> Any:
+        try:
+            value = await fetch()
+            self.set(key, value, ttl=ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    # -------------------- Intern --------------------
+
+    def _expired(self, entry: _Entry, now: Optional[float] = None) -> bool:
+        if entry.expires_at is None:
+            return False
+        return (self._clock() if now is None else now) >= entry.expires_at
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self.bytes > self.max_bytes and len(self._entries) > 1)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self.bytes -= entry.size
+            self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 3) if lookups else None,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,228 @@
+"""
+Export/Import der Bot-Tabellen (favs, reminders, stars, wishlist).
+
+Formate: NDJSON (ein Objekt pro Zeile, ``.ndjson`` oder ``.ndjson.gz``) oder
+gzip-CSV (``.csv.gz``, Kopfzeile mit Spaltennamen, ``\\N`` = NULL; Texte, die
+mit ``\\`` beginnen, bekommen ein weiteres ``\\`` vorangestellt). Beides wird
+gestreamt – der Speicherbedarf hängt nicht von der Tabellengröße ab:
+
+- Export liest per ``fetchmany`` in Blöcken von ``CHUNK_SIZE`` Zeilen aus
+  EINER Lese-Transaktion (konsistenter Stand; im WAL-Modus blockiert das den
+  Bot nicht) und schreibt atomar (``.tmp`` + ``os.replace``).
+- Import reicht einen Generator über die Datei direkt an ``executemany``.
+  ``import_file`` liest dabei zuerst in eine temporäre Staging-DB und
+  übernimmt alles mit EINEM ``INSERT … SELECT`` – alles oder nichts, und
+  die Schreibsperre auf der Bot-DB hält nur dafür, nicht für die ganze Datei.
+
+CLI:
+    python -m utils.db_export export reminder-wishlist.db favs favs.ndjson.gz
+    python -m utils.db_export import reminder-wishlist.db favs favs.ndjson.gz [--replace]
+"""
+
+import argparse
+import csv
+import gzip
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+from typing import IO, Any, Iterator, Optional
+
+TABLES = ("favs", "reminders", "stars", "wishlist")
+FORMATS = ("ndjson", "csv")
+CHUNK_SIZE = 5000
+CSV_NULL = "\\N"
+CSV_ESCAPE = "\\"
+
+
+def detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    return "csv" if name.endswith(".csv") else "ndjson"
+
+
+def default_filename(table: str, fmt: str) -> str:
+    return f"{table}.csv.gz" if fmt == "csv" else f"{table}.ndjson.gz"
+
+
+def _open(path: str, mode: str, compressed: Optional[bool] = None) -> IO[str]:
+    if path.endswith(".gz") if compressed is None else compressed:
+        # niedrige Stufe: Export ist I/O-lastig, Stufe 9 kostet ein Vielfaches an CPU
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="", compresslevel=5)
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def _csv_out(value: Any) -> Any:
+    if value is None:
+        return CSV_NULL
+    if isinstance(value, str) and value.startswith(CSV_ESCAPE):
+        return CSV_ESCAPE + value  # "\\N" als Text ≠ NULL
+    return value
+
+
+def _csv_in(value: str) -> Optional[str]:
+    if value == CSV_NULL:
+        return None
+    return value[1:] if value.startswith(CSV_ESCAPE) else value
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    if table not in TABLES:
+        raise ValueError(f"Unbekannte Tabelle: {table} (erlaubt: {', '.join(TABLES)})")
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+# -------------------- Export --------------------
+
+def export_table(conn: sqlite3.Connection, table: str, path: str, fmt: Optional[str] = None) -> int:
+    """Schreibt ``table`` nach ``path``, gibt die Anzahl Zeilen zurück."""
+    fmt = fmt or detect_format(path)
+    columns = table_columns(conn, table)
+    cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid")
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with _open(tmp_path, "w", compressed=path.endswith(".gz")) as f:
+        writer = csv.writer(f) if fmt == "csv" else None
+        if writer is not None:
+            writer.writerow(columns)
+        while rows := cursor.fetchmany(CHUNK_SIZE):
+            if writer is not None:
+                writer.writerows(map(_csv_out, row) for row in rows)
+            else:
+                f.writelines(
+                    json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in rows)
+            count += len(rows)
+    os.replace(tmp_path, path)
+    return count
+
+
+def export_file(db_path: str, table: str, path: str, fmt: Optional[str] = None) -> int:
+    """Export über eine eigene (Lese-)Verbindung, z. B. per ``asyncio.to_thread``."""
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:  # eine Lese-Transaktion = ein konsistenter Snapshot
+            conn.execute("BEGIN")
+            return export_table(conn, table, path, fmt)
+    finally:
+        conn.close()
+
+
+# -------------------- Import --------------------
+
+def _rows(f: IO[str], fmt: str) -> tuple[list[str], Iterator[tuple]]:
+    """Spalten der Datei + Zeilen-Generator (liest die Datei nicht ganz ein)."""
+    if fmt == "csv":
+        reader = csv.reader(f)
+        header = next(reader, [])
+        return header, (tuple(map(_csv_in, row)) for row in reader)
+    lines = (line for line in f if line.strip())
+    first = next(lines, None)
+    if first is None:
+        return [], iter(())
+    header = list(json.loads(first))
+    objects = map(json.loads, itertools.chain((first,), lines))
+    return header, (tuple(obj.get(c) for c in header) for obj in objects)
+
+
+def _header(path: str, fmt: str) -> list[str]:
+    with _open(path, "r") as f:
+        return _rows(f, fmt)[0]
+
+
+def import_table(
+    conn: sqlite3.Connection,
+    table: str,
+    path: str,
+    fmt: Optional[str] = None,
+    replace: bool = False,
+    *,
+    schema: str = "main",
+) -> int:
+    """
+    Importiert ``path`` per ``executemany`` in ``schema.table`` (Transaktion
+    stellt der Aufrufer). Vorhandene IDs werden übersprungen bzw. mit
+    ``replace`` überschrieben. Gibt die Anzahl gelesener Zeilen zurück.
+    """
+    fmt = fmt or detect_format(path)
+    columns = table_columns(conn, table)
+    with _open(path, "r") as f:
+        header, rows = _rows(f, fmt)
+        unknown = [c for c in header if c not in columns]
+        if unknown:
+            raise ValueError(f"Unbekannte Spalten in {path}: {', '.join(unknown)}")
+        if not header:
+            return 0
+        count = 0
+
+        def counted() -> Iterator[tuple[Any, ...]]:
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        conn.executemany(
+            f"{verb} INTO {schema}.{table} ({', '.join(header)}) VALUES ({', '.join('?' * len(header))})",
+            counted(),
+        )
+        return count
+
+
+def import_file(db_path: str, table: str, path: str, fmt: Optional[str] = None, replace: bool = False) -> int:
+    """
+    Import über eine eigene Verbindung, z. B. per ``asyncio.to_thread``. Die
+    Datei landet erst in einer temporären Staging-DB; in die Bot-DB schreibt
+    dann ein einziges ``INSERT … SELECT`` in einer Transaktion.
+    """
+    fmt = fmt or detect_format(path)
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        table_columns(conn, table)  # Tabellenname prüfen, bevor er ins SQL geht
+        header = _header(path, fmt)
+        conn.execute("ATTACH DATABASE '' AS staging")
+        # ohne Constraints: Duplikate klärt erst das INSERT in die Bot-DB
+        conn.execute(f"CREATE TABLE staging.{table} AS SELECT * FROM main.{table} WHERE 0")
+        with conn:
+            count = import_table(conn, table, path, fmt, schema="staging")
+        if not header:
+            return 0
+        columns = ", ".join(header)
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        with conn:
+            conn.execute(
+                f"{verb} INTO main.{table} ({columns}) SELECT {columns} FROM staging.{table} ORDER BY rowid")
+        return count
+    finally:
+        conn.close()
+
+
+# -------------------- CLI --------------------
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Exportiert/importiert Bot-Tabellen als NDJSON oder gzip-CSV (gestreamt).")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("export", "import"):
+        p = sub.add_parser(name)
+        p.add_argument("db_path", help="SQLite-Datei (z. B. reminder-wishlist.db)")
+        p.add_argument("table", choices=TABLES)
+        p.add_argument("path", help="Datei (.ndjson[.gz] oder .csv[.gz])")
+        p.add_argument("--format", choices=FORMATS, default=None,
+                       help="Format erzwingen (Standard: aus der Dateiendung)")
+    sub.choices["import"].add_argument(
+        "--replace", action="store_true", help="Vorhandene IDs überschreiben statt überspringen")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.command == "export":
+        count = export_file(args.db_path, args.table, args.path, args.format)
+        print(f"{args.table} → {args.path} ({count} Zeilen, {time.perf_counter() - started:.1f}s)")
+    else:
+        count = import_file(args.db_path, args.table, args.path, args.format, args.replace)
+        print(f"{args.path} → {args.table} ({count} Zeilen, {time.perf_counter() - started:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import bisect
+import difflib
+import random
+from typing import Iterable, Optional
+
+FUZZY_CUTOFF = 0.6
+FUZZY_MAX_RESULTS = 5
+# Vorfilter: nur Namen mit genug gemeinsamen Bigrammen gehen an difflib
+FUZZY_MIN_DICE = 0.3
+
+
+def normalize(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def bigrams(key: str) -> frozenset[str]:
+    padded = f" {key} "
+    return frozenset(padded[i:i + 2] for i in range(len(padded) - 1))
+
+
+class _UserFavs:
+    __slots__ = ("by_name", "keys", "grams")
+
+    def __init__(self):
+        self.by_name: dict[str, list[tuple[int, str]]] = {}  # key -> [(fav_id, Originalname)]
+        self.keys: list[str] = []  # sortiert, für Prefix-Suche per bisect
+        self.grams: dict[str, frozenset[str]] = {}  # key -> Bigramme (Fuzzy-Vorfilter)
+
+
+class FavNameIndex:
+    """In-Memory-Namensindex der Favs pro User.
+
+    Hält pro User die normalisierten Namen sortiert (Prefix-Suche per
+    ``bisect`` statt Trie) und beantwortet Lookups ohne DB-Scan:
+    exakter Name → Teilstring (wie das alte ``LIKE %name%``) → unscharf
+    (Bigramm-Vorfilter + ``difflib``, fängt Tippfehler ab).
+    """
+
+    def __init__(self):
+        self._users: dict[int, _UserFavs] = {}
+        self._owner: dict[int, tuple[int, str]] = {}  # fav_id -> (user_id, key)
+
+    def __len__(self) -> int:
+        return len(self._owner)
+
+    def load(self, rows: Iterable[tuple[int, int, str]]) -> None:
+        """Baut den Index aus ``(fav_id, user_id, name)``-Zeilen neu auf."""
+        self._users.clear()
+        self._owner.clear()
+        for fav_id, user_id, name in rows:
+            self.add(user_id, fav_id, name)
+
+    def add(self, user_id: int, fav_id: int, name: str) -> None:
+        if not name:
+            return
+        key = normalize(name)
+        user = self._users.setdefault(user_id, _UserFavs())
+        entries = user.by_name.get(key)
+        if entries is None:
+            entries = user.by_name[key] = []
+            bisect.insort(user.keys, key)
+            user.grams[key] = bigrams(key)
+        entries.append((fav_id, name))
+        self._owner[fav_id] = (user_id, key)
+
+    def remove(self, fav_id: int) -> None:
+        owner = self._owner.pop(fav_id, None)
+        if owner is None:
+            return
+        user_id, key = owner
+        user = self._users[user_id]
+        entries = [e for e in user.by_name[key] if e[0] != fav_id]
+        if entries:
+            user.by_name[key] = entries
+            return
+        del user.by_name[key]
+        del user.grams[key]
+        del user.keys[bisect.bisect_left(user.keys, key)]
+        if not user.keys:
+            del self._users[user_id]
+
+    # -------------------- Abfragen --------------------
+
+    def _prefixed(self, user: _UserFavs, prefix: str) -> Iterable[str]:
+        i = bisect.bisect_left(user.keys, prefix)
+        while i < len(user.keys) and user.keys[i].startswith(prefix):
+            yield user.keys[i]
+            i += 1
+
+    def _fuzzy(self, user: _UserFavs, query: str) -> list[str]:
+        query_grams = bigrams(query)
+        candidates = [
+            key for key, grams in user.grams.items()
+            if 2 * len(query_grams & grams) >= FUZZY_MIN_DICE * (len(query_grams) + len(grams))
+        ]
+        return difflib.get_close_matches(query, candidates, n=FUZZY_MAX_RESULTS, cutoff=FUZZY_CUTOFF)
+
+    def find(self, user_id: int, query: str) -> list[int]:
+        """Fav-IDs zu ``query``: exakt, sonst Teilstring, sonst unscharf."""
+        user = self._users.get(user_id)
+        query = normalize(query)
+        if user is None or not query:
+            return []
+        if query in user.by_name:
+            keys = [query]
+        else:
+            keys = [k for k in user.keys if query in k] or self._fuzzy(user, query)
+        return [fav_id for key in keys for fav_id, _ in user.by_name[key]]
+
+    def complete(self, user_id: int, current: str, limit: int = 25) -> list[str]:
+        """Namensvorschläge fürs Autocomplete: Prefix → Teilstring → unscharf."""
+        user = self._users.get(user_id)
+        if user is None:
+            return []
+        current = normalize(current)
+        keys: list[str] = []
+        for key in self._prefixed(user, current):
+            keys.append(key)
+            if len(keys) >= limit:
+                break
+        if current and len(keys) < limit:
+            seen = set(keys)
+            keys += [k for k in user.keys if current in k and k not in seen][:limit - len(keys)]
+        if current and not keys:
+            keys = self._fuzzy(user, current)
+        return [user.by_name[key][0][1] for key in keys]
+
+
+class _IdBag:
+    """Menge von IDs mit O(1) add/remove/zufälliger Auswahl (Liste + Positionen)."""
+
+    __slots__ = ("ids", "pos")
+
+    def __init__(self):
+        self.ids: list[int] = []
+        self.pos: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, item: int) -> None:
+        if item not in self.pos:
+            self.pos[item] = len(self.ids)
+            self.ids.append(item)
+
+    def remove(self, item: int) -> None:
+        i = self.pos.pop(item, None)
+        if i is None:
+            return
+        last = self.ids.pop()
+        if last != item:
+            # letztes Element in die Lücke ziehen
+            self.ids[i] = last
+            self.pos[last] = i
+
+    def choice(self) -> Optional[int]:
+        return random.choice(self.ids) if self.ids else None
+
+
+class FavIdIndex:
+    """Fav-IDs gesamt, pro User und pro Channel für gleichverteilte Zufallsauswahl.
+
+    Ersetzt ``ORDER BY RANDOM()`` (sortiert die ganze Tabelle) durch
+    ``random.choice`` auf gecachten ID-Listen; Löschen per Swap-Remove.
+    """
+
+    def __init__(self):
+        self._all = _IdBag()
+        self._by_user: dict[int, _IdBag] = {}
+        self._by_channel: dict[int, _IdBag] = {}
+        self._owner: dict[int, tuple[int, int]] = {}  # fav_id -> (user_id, channel_id)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def load(self, rows: Iterable[tuple[int, int, int]]) -> None:
+        """Baut den Index aus ``(fav_id, user_id, channel_id)``-Zeilen neu auf."""
+        self._all = _IdBag()
+        self._by_user.clear()
+        self._by_channel.clear()
+        self._owner.clear()
+        for fav_id, user_id, channel_id in rows:
+            self.add(fav_id, user_id, channel_id)
+
+    def add(self, fav_id: int, user_id: int, channel_id: int) -> None:
+        self._all.add(fav_id)
+        self._by_user.setdefault(user_id, _IdBag()).add(fav_id)
+        self._by_channel.setdefault(channel_id, _IdBag()).add(fav_id)
+        self._owner[fav_id] = (user_id, channel_id)
+
+    def remove(self, fav_id: int) -> None:
+        owner = self._owner.pop(fav_id, None)
+        if owner is None:
+            return
+        self._all.remove(fav_id)
+        for bags, key in ((self._by_user, owner[0]), (self._by_channel, owner[1])):
+            bag = bags[key]
+            bag.remove(fav_id)
+            if not bag:
+                del bags[key]
+
+    def pick(self, *, user_id: Optional[int] = None, channel_id: Optional[int] = None) -> Optional[int]:
+        """Zufällige Fav-ID, optional auf User und/oder Channel eingeschränkt."""
+        if user_id is None and channel_id is None:
+            return self._all.choice()
+        if channel_id is None:
+            bag = self._by_user.get(user_id)
+            return bag.choice() if bag else None
+        if user_id is None:
+            bag = self._by_channel.get(channel_id)
+            return bag.choice() if bag else None
+        # beides: über die kleinere Menge filtern
+        user_bag = self._by_user.get(user_id)
+        channel_bag = self._by_channel.get(channel_id)
+        if not user_bag or not channel_bag:
+            return None
+        small = user_bag if len(user_bag) <= len(channel_bag) else channel_bag
+        ids = [i for i in small.ids if self._owner[i] == (user_id, channel_id)]
+        return random.choice(ids) if ids else None
@@ -0,0 +1,238 @@
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+
+from utils.logging_helper import log_event
+from utils.storage import Storage
+
+logger = logging.getLogger("ZicklaaBotRewrite.FootballData")
+
+BASE = "https://api.football-data.org/v4"
+
+# Verbindungen & Zeitlimits
+MAX_CONNECTIONS = 4
+CONNECT_TIMEOUT_SECONDS = 5
+TOTAL_TIMEOUT_SECONDS = 15
+
+# Wiederholungen bei Netzfehlern / 5xx / 429
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+RATE_LIMIT_FALLBACK_SECONDS = 60  # wenn 429 ohne Reset-Header kommt
+
+
+class FootballDataError(RuntimeError):
+    """Fehlerhafte Antwort von football-data.org (nach allen Wiederholungen)."""
+
+    def __init__(self, status: Optional[int], message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class FootballDataClient:
+    """Asynchroner Client für football-data.org mit Connection-Pool.
+
+    - eine ``aiohttp.ClientSession`` mit begrenztem Connection-Pool,
+    - Zeitlimits für Verbindungsaufbau und Gesamtdauer,
+    - Wiederholungen mit exponentiellem Backoff (+ Jitter) bei Netzfehlern
+      und 5xx,
+    - Rate-Limit: ``X-Requests-Available-Minute`` / ``X-RequestCounter-Reset``
+      werden ausgewertet. Ist das Kontingent leer (oder kommt ein 429),
+      warten alle folgenden Requests bis zum Reset statt weiter anzuklopfen.
+    - Optional persistenter Antwort-Cache in der Bot-DB (Tabelle
+      ``http_cache``): ETag/Last-Modified für bedingte Requests (304 →
+      gespeicherte Antwort), Expiry aus ``Cache-Control: max-age``/``Expires``.
+      ``cached`` liefert die letzte Antwort ohne Netz (Warmstart).
+
+    Args:
+        api_token: Wert für den ``X-Auth-Token``-Header.
+        base: Basis-URL der API.
+        db: ``Storage`` für den persistenten Cache (``None`` = aus).
+    """
+
+    def __init__(self, api_token: str, *, base: str = BASE, db: Optional[Storage] = None):
+        self.api_token = api_token
+        self.base = base
+        self.db = db
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._blocked_until = 0.0  # monotonic
+        self.requests_available: Optional[int] = None
+
+    async def start(self) -> None:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"X-Auth-Token": self.api_token},
+                connector=aiohttp.TCPConnector(limit=MAX_CONNECTIONS, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(
+                    total=TOTAL_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS),
+            )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # -------------------- Rate-Limit --------------------
+
+    def _note_rate_limit(self, headers: Any, status: int) -> None:
+        available = headers.get("X-Requests-Available-Minute")
+        reset = headers.get("X-RequestCounter-Reset")
+        exhausted = False
+        if available is not None and available.isdigit():
+            self.requests_available = int(available)
+            exhausted = self.requests_available == 0
+        if status == 429 or exhausted:
+            wait = int(reset) if reset and reset.isdigit() else RATE_LIMIT_FALLBACK_SECONDS
+            self._blocked_until = max(self._blocked_until, time.monotonic() + wait)
+            log_event(
+                logger,
+                logging.WARNING,
+                self.__class__.__name__,
+                "rate_limited",
+                status=status,
+                available=self.requests_available,
+                wait_s=wait,
+            )
+
+    async def _wait_for_quota(self) -> None:
+        delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.0)
+
+    # -------------------- Persistenter Cache --------------------
+
+    @staticmethod
+    def cache_key(path: str, params: Optional[dict] = None) -> str:
+        return f"{path}?{urlencode(sorted(params.items()))}" if params else path
+
+    async def _load_entry(self, key: str) -> Optional[tuple]:
+        if self.db is None:
+            return None
+        return await self.db.fetchone(
+            "SELECT etag, last_modified, fetched_at, expires_at, body FROM http_cache WHERE key = ?",
+            (key,),
+        )
+
+    async def _store_entry(self, key: str, headers: Any, body: str, previous: Optional[tuple]) -> None:
+        if self.db is None:
+            return
+        now = time.time()
+        expires_at = _expires_at(headers, now)
+        if previous is not None and previous[4] == body:
+            # unverändert (auch 304) → nur Metadaten auffrischen, Body nicht neu schreiben
+            await self.db.execute(
+                "UPDATE http_cache SET etag = ?, last_modified = ?, fetched_at = ?, expires_at = ? WHERE key = ?",
+                (
+                    headers.get("ETag") or previous[0],
+                    headers.get("Last-Modified") or previous[1],
+                    now,
+                    expires_at,
+                    key,
+                ),
+            )
+            return
+        await self.db.execute(
+            """
+            INSERT INTO http_cache(key, etag, last_modified, fetched_at, expires_at, body)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                etag = excluded.etag, last_modified = excluded.last_modified,
+                fetched_at = excluded.fetched_at, expires_at = excluded.expires_at,
+                body = excluded.body
+            """,
+            (key, headers.get("ETag"), headers.get("Last-Modified"), now, expires_at, body),
+        )
+
+    async def cached(self, path: str, params: Optional[dict] = None) -> Optional[tuple[dict, float]]:
+        """Letzte gespeicherte Antwort + Abrufzeit (Unix), ohne Netzwerk."""
+        entry = await self._load_entry(self.cache_key(path, params))
+        if entry is None:
+            return None
+        return json.loads(entry[4]), entry[2]
+
+    # -------------------- Requests --------------------
+
+    async def get(self, path: str, params: Optional[dict] = None) -> dict:
+        """GET auf ``path`` (z. B. ``/competitions/BL1/matches``), gibt JSON zurück."""
+        key = self.cache_key(path, params)
+        entry = await self._load_entry(key)
+        if entry is not None and entry[3] is not None and time.time() < entry[3]:
+            return json.loads(entry[4])
+
+        await self.start()
+        url = f"{self.base}{path}"
+        headers = {}
+        if entry is not None:
+            if entry[0]:
+                headers["If-None-Match"] = entry[0]
+            if entry[1]:
+                headers["If-Modified-Since"] = entry[1]
+        last_error: Optional[FootballDataError] = None
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self._wait_for_quota()
+            try:
+                async with self._session.get(url, params=params, headers=headers) as resp:
+                    self._note_rate_limit(resp.headers, resp.status)
+                    if resp.status == 304 and entry is not None:
+                        await self._store_entry(key, resp.headers, entry[4], entry)
+                        return json.loads(entry[4])
+                    if resp.status == 200:
+                        body = await resp.text()
+                        data = json.loads(body)
+                        await self._store_entry(key, resp.headers, body, entry)
+                        return data
+                    text = await resp.text()
+                    last_error = FootballDataError(
+                        resp.status, f"API Fehler {resp.status}: {text[:300]}")
+                    # 4xx (außer 429) wird durch Wiederholen nicht besser
+                    if resp.status != 429 and resp.status < 500:
+                        raise last_error
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = FootballDataError(None, f"Netzwerkfehler: {e!r}")
+
+            if attempt < MAX_RETRIES:
+                # nach 429 wartet _wait_for_quota bis zum Reset
+                if last_error.status != 429:
+                    await asyncio.sleep(self._backoff(attempt))
+                log_event(
+                    logger,
+                    logging.INFO,
+                    self.__class__.__name__,
+                    "retry",
+                    path=path,
+                    attempt=attempt + 1,
+                    error=last_error,
+                )
+
+        raise last_error
+
+
+def _expires_at(headers: Any, now: float) -> Optional[float]:
+    """Ablaufzeit aus ``Cache-Control: max-age`` bzw. ``Expires`` (sonst None)."""
+    cache_control = headers.get("Cache-Control") or ""
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return None
+    match = re.search(r"max-age=(\d+)", cache_control)
+    if match:
+        return now + int(match.group(1))
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return None
+    return None
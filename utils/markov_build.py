@@ -0,0 +1,158 @@
+"""
+Baut das Hivemind-Markov-Modell aus Nachrichtenverläufen neu.
+
+Nachrichten kommen als NDJSON-Dump (eine Nachricht pro Zeile, mindestens
+``{"content": "..."}``) – entweder von ``/hivemind_build`` live aus Discord
+aufgezeichnet oder von Hand erstellt. Der Dump wird gestreamt, in Shards
+aufgeteilt und parallel in einem Prozess-Pool zu markovify-Ketten gebaut;
+``markovify.combine`` fügt die Shards zusammen. JSON (und kompilierte
+Variante, siehe ``utils.markov_store``) werden atomar geschrieben.
+
+Der Bot startet den Build als eigenen Prozess (``python -m``): spawn-Worker
+importieren das Hauptmodul neu, aus dem Bot heraus wäre das ``bot.py``.
+
+CLI:
+    python -m utils.markov_build dump.ndjson [-o static/hivemind.json]
+        [--workers N] [--shard-size N] [--state-size N]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Optional
+
+import markovify
+
+from utils.markov_store import compiled_path_for, write_compiled
+
+SHARD_SIZE = 20_000  # Nachrichten pro Shard
+STATE_SIZE = 2
+
+
+def message_record(message: Any) -> dict[str, Any]:
+    """Zeile für den NDJSON-Dump aus einer discord.Message."""
+    return {
+        "id": message.id,
+        "channel_id": message.channel.id,
+        "author_id": message.author.id,
+        "content": message.content,
+    }
+
+
+def keep_message(content: str) -> bool:
+    """Filtert Leeres, Prefix-/Slash-Commands und reine Links."""
+    content = (content or "").strip()
+    if not content or content[0] in "+/!":
+        return False
+    return not content.startswith(("http://", "https://"))
+
+
+def iter_dump(path: str) -> Iterator[str]:
+    """Streamt die Nachrichtentexte eines NDJSON-Dumps (konstanter Speicher)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            content = json.loads(line).get("content") or ""
+            if keep_message(content):
+                yield content
+
+
+def iter_shards(texts: Iterable[str], shard_size: int) -> Iterator[list[str]]:
+    shard: list[str] = []
+    for text in texts:
+        shard.append(text)
+        if len(shard) >= shard_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def build_shard(texts: list[str], state_size: int) -> markovify.NewlineText:
+    """Worker: baut die Kette für einen Shard (eine Nachricht = ein Satz)."""
+    return markovify.NewlineText("\n".join(texts), state_size=state_size)
+
+
+def build_model(
+    texts: Iterable[str],
+    *,
+    workers: Optional[int] = None,
+    shard_size: int = SHARD_SIZE,
+    state_size: int = STATE_SIZE,
+) -> markovify.Text:
+    """Baut Shards parallel und kombiniert sie zu einem Modell."""
+    workers = workers or os.cpu_count() or 1
+    models: list[markovify.Text] = []
+    pending: deque[Future] = deque()
+    # spawn statt fork: keine geerbten Threads/Locks des Aufrufers
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        for shard in iter_shards(texts, shard_size):
+            # max. 2 Shards pro Worker gleichzeitig im Speicher
+            if len(pending) >= 2 * workers:
+                models.append(pending.popleft().result())
+            pending.append(pool.submit(build_shard, shard, state_size))
+        models.extend(f.result() for f in pending)
+    if not models:
+        raise ValueError("Keine verwertbaren Nachrichten im Dump.")
+    return models[0] if len(models) == 1 else markovify.combine(models)
+
+
+def write_model(model: markovify.Text, json_path: str, *, compiled: bool = True) -> None:
+    """Schreibt die JSON atomar (gleiches Format wie bisher) + kompilierte Variante."""
+    tmp_path = f"{json_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(model.to_json(), f)
+    os.replace(tmp_path, json_path)
+    if compiled:
+        write_compiled(model, compiled_path_for(json_path))
+
+
+def build_from_dump(
+    dump_path: str,
+    json_path: str,
+    *,
+    workers: Optional[int] = None,
+    shard_size: int = SHARD_SIZE,
+    state_size: int = STATE_SIZE,
+) -> markovify.Text:
+    """Kompletter Offline-Lauf: Dump → Modell → Dateien."""
+    model = build_model(
+        iter_dump(dump_path), workers=workers, shard_size=shard_size, state_size=state_size
+    )
+    write_model(model, json_path)
+    return model
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Baut das Hivemind-Modell aus einem NDJSON-Nachrichtendump.")
+    parser.add_argument("dump_path", help="NDJSON-Dump (ein Objekt mit 'content' pro Zeile)")
+    parser.add_argument("-o", "--output", default="static/hivemind.json",
+                        help="Ziel-JSON (Standard: static/hivemind.json)")
+    parser.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: CPU-Anzahl)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument("--state-size", type=int, default=STATE_SIZE)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    model = build_from_dump(
+        args.dump_path, args.output,
+        workers=args.workers, shard_size=args.shard_size, state_size=args.state_size,
+    )
+    print(
+        f"{args.dump_path} → {args.output} "
+        f"({len(model.chain.model)} States, {time.perf_counter() - started:.1f}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Kompiliertes On-Disk-Format für das Hivemind-Markov-Modell.
+
+``static/hivemind.json`` (markovify-JSON) wird beim Start dreifach geparst
+(Datei → Dict → Chain-JSON) und hält Ketten-Dicts plus ``parsed_sentences``
+im RAM. Das kompilierte Format speichert stattdessen:
+- die bereits kompilierte Kette (state → [Wörter, kumulierte Gewichte]),
+- alle Wörter/States ``sys.intern``-t (Pickle-Memo → jedes Wort nur einmal
+  in Datei und RAM),
+- nur den ``rejoined_text`` für den Overlap-Test statt der Satzlisten.
+
+CLI:
+    python -m utils.markov_store static/hivemind.json [-o static/hivemind.pkl]
+"""
+
+import argparse
+import gc
+import json
+import os
+import pickle
+import sys
+import time
+from typing import Any, Optional
+
+import markovify
+
+FORMAT_VERSION = 1
+
+
+class CompiledText(markovify.Text):
+    """markovify.Text aus einer kompilierten Kette, ohne ``parsed_sentences``."""
+
+    def __init__(self, chain: markovify.Chain, rejoined_text: Optional[str] = None):
+        super().__init__(
+            None, state_size=chain.state_size, chain=chain, retain_original=False
+        )
+        if rejoined_text is not None:
+            # reicht make_sentence() für den max_overlap-Test
+            self.rejoined_text = rejoined_text
+
+
+def compiled_path_for(json_path: str) -> str:
+    """Standardpfad der kompilierten Datei neben der JSON (hivemind.pkl)."""
+    return os.path.splitext(json_path)[0] + ".pkl"
+
+
+def load_json_model(json_path: str) -> markovify.Text:
+    """Lädt das Modell klassisch aus der markovify-JSON."""
+    with open(json_path, encoding="utf-8") as json_file:
+        hivemind_json = json.load(json_file)
+    if isinstance(hivemind_json, str):
+        return markovify.Text.from_json(hivemind_json)
+    return markovify.Text.from_dict(hivemind_json)
+
+
+def _intern_state(state: tuple) -> tuple:
+    return tuple(sys.intern(w) for w in state)
+
+
+def compile_model(model: markovify.Text) -> dict[str, Any]:
+    """Wandelt ein markovify.Text in die kompakte, picklebare Struktur um."""
+    chain = model.chain if model.chain.compiled else model.chain.compile()
+    compiled: dict[tuple, list] = {}
+    for state, (words, cumdist) in chain.model.items():
+        compiled[_intern_state(state)] = [
+            [sys.intern(w) for w in words], list(cumdist)]
+    return {
+        "format": FORMAT_VERSION,
+        "state_size": chain.state_size,
+        "model": compiled,
+        "rejoined_text": getattr(model, "rejoined_text", None),
+    }
+
+
+def write_compiled(model: markovify.Text, out_path: str) -> None:
+    """Schreibt das kompilierte Modell atomar (tmp + rename)."""
+    tmp_path = f"{out_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(compile_model(model), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, out_path)
+
+
+def load_compiled(path: str) -> CompiledText:
+    """Lädt ein mit ``write_compiled`` erzeugtes Modell."""
+    # GC während des Ladens aus: Millionen kleiner Listen/Tupel würden
+    # sonst ständig Generationen-Scans auslösen
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    if data.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Unbekanntes Modellformat in {path}: {data.get('format')}")
+    chain = markovify.Chain(None, data["state_size"], model=data["model"])
+    return CompiledText(chain, data["rejoined_text"])
+
+
+def load_model(json_path: str, compiled_path: Optional[str] = None) -> markovify.Text:
+    """
+    Lädt das kompilierte Modell, wenn es existiert und nicht älter als die
+    JSON ist – sonst Fallback auf die JSON.
+    """
+    compiled_path = compiled_path or compiled_path_for(json_path)
+    try:
+        if os.path.getmtime(compiled_path) >= os.path.getmtime(json_path):
+            return load_compiled(compiled_path)
+    except (OSError, ValueError, pickle.UnpicklingError):
+        pass
+    return load_json_model(json_path)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Kompiliert eine markovify-JSON in das schnelle Binärformat.")
+    parser.add_argument("json_path", help="Pfad zur hivemind.json")
+    parser.add_argument("-o", "--output", help="Zieldatei (Standard: <json>.pkl)")
+    args = parser.parse_args(argv)
+
+    out_path = args.output or compiled_path_for(args.json_path)
+    started = time.perf_counter()
+    model = load_json_model(args.json_path)
+    write_compiled(model, out_path)
+    print(
+        f"{args.json_path} → {out_path} "
+        f"({len(model.chain.model)} States, {time.perf_counter() - started:.1f}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+import discord
+
+from utils.async_cache import AsyncCache
+from utils.logging_helper import log_event
+
+logger = logging.getLogger("ZicklaaBotRewrite.MessagePool")
+
+MESSAGE_CACHE_ENTRIES = 2048
+# Gefetchte Message-Objekte werden vom Gateway nicht aktualisiert → kurz halten
+MESSAGE_TTL_SECONDS = 600
+# Gelöschte/unzugängliche Nachrichten kommen selten zurück
+NEGATIVE_TTL_SECONDS = 3600
+MAX_CONCURRENT_FETCHES = 4
+
+_GONE = object()  # Marker im Cache für NotFound/Forbidden
+
+
+class MessagePool:
+    """Gemeinsamer Fetch-Pool für Nachrichten aller Cogs.
+
+    - LRU-Cache (``AsyncCache``) über ``(channel_id, message_id)``,
+    - gleichzeitige Fetches derselben Nachricht teilen sich einen Request,
+    - höchstens ``MAX_CONCURRENT_FETCHES`` REST-Calls gleichzeitig, damit
+      Batches (``fetch_many``) nicht in Discords Rate-Limit laufen,
+    - Negativ-Cache: gelöschte bzw. nicht lesbare Nachrichten liefern
+      ``None``, ohne erneut anzufragen,
+    - Hit-Rate pro Cog (``stats``; Cache-, Negativ- und Coalescing-Treffer).
+
+    Args:
+        bot: Der Bot (für ``get_channel``/``fetch_channel``).
+    """
+
+    def __init__(self, bot: discord.Client):
+        self.bot = bot
+        self._cache = AsyncCache(ttl=MESSAGE_TTL_SECONDS, max_entries=MESSAGE_CACHE_ENTRIES)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._stats: dict[str, Counter] = {}
+
+    async def fetch(
+        self, channel_id: int, message_id: int, *, cog: str, force: bool = False
+    ) -> Optional[discord.Message]:
+        """
+        Nachricht aus dem Cache oder per REST. ``None``, wenn sie gelöscht
+        oder nicht lesbar ist. ``force`` holt frisch (z. B. für aktuelle
+        Reaktionszahlen), coalesct aber trotzdem.
+        """
+        key = (channel_id, message_id)
+        cached = None if force else self._cache.peek(key)
+        counter = self._stats.setdefault(cog, Counter())
+        if cached is _GONE:
+            counter["negative_hits"] += 1
+            return None
+        if cached is not None:
+            counter["hits"] += 1
+            self._cache.get(key)  # LRU auffrischen
+            return cached
+        if self._cache.inflight(key):
+            counter["coalesced"] += 1
+        else:
+            counter["refreshes" if force else "misses"] += 1
+
+        message = await self._cache.get_or_fetch(
+            key, lambda: self._fetch(channel_id, message_id), force=force)
+        if message is _GONE:
+            self._cache.set(key, _GONE, ttl=NEGATIVE_TTL_SECONDS)
+            return None
+        return message
+
+    async def fetch_many(
+        self, ids: Iterable[tuple[int, int]], *, cog: str
+    ) -> list[Optional[discord.Message]]:
+        """Mehrere ``(channel_id, message_id)`` parallel (begrenzt), in Eingabereihenfolge."""
+        return await asyncio.gather(
+            *(self.fetch(channel_id, message_id, cog=cog) for channel_id, message_id in ids))
+
+    async def history(self, channel: discord.abc.Messageable, *, cog: str, **kwargs: Any) -> list[discord.Message]:
+        """``channel.history(**kwargs)`` als Liste, im selben Concurrency-Limit wie Einzel-Fetches."""
+        self._stats.setdefault(cog, Counter())["history_calls"] += 1
+        async with self._semaphore:
+            return [m async for m in channel.history(**kwargs)]
+
+    def prime(self, messages: Iterable[discord.Message]) -> None:
+        """Bereits vorliegende Nachrichten (z. B. Pins) in den Cache legen."""
+        for message in messages:
+            self._cache.set((message.channel.id, message.id), message)
+
+    async def _fetch(self, channel_id: int, message_id: int) -> Any:
+        async with self._semaphore:
+            try:
+                channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+                return await channel.fetch_message(message_id)
+            except (discord.NotFound, discord.Forbidden) as e:
+                log_event(
+                    logger,
+                    logging.INFO,
+                    self.__class__.__name__,
+                    "message_unavailable",
+                    channel_id=channel_id,
+                    message_id=message_id,
+                    error=e,
+                )
+                return _GONE
+
+    def stats(self) -> dict[str, Any]:
+        per_cog = {}
+        for cog, counter in sorted(self._stats.items()):
+            # Hit = ohne eigenen REST-Call bedient
+            hits = counter["hits"] + counter["negative_hits"] + counter["coalesced"]
+            lookups = hits + counter["misses"]
+            per_cog[cog] = {
+                **counter,
+                "hit_rate": round(hits / lookups, 3) if lookups else None,
+            }
+        return {"cache": self._cache.stats(), "cogs": per_cog}
@@ -0,0 +1,48 @@
+import asyncio
+import time
+from typing import Any, Callable
+
+
+class ModelRegistry:
+    """Hält das aktuelle Hivemind-Modell und tauscht es zur Laufzeit aus.
+
+    Cogs (bzw. ``SentenceService``) fragen ``registry.model`` bei jeder
+    Nutzung ab, statt eine Referenz zu behalten. ``reload`` lädt im
+    Hintergrund-Thread und tauscht danach per einfacher Zuweisung – laufende
+    Generierungen arbeiten mit dem alten Modell zu Ende, danach wird es
+    freigegeben (keine weiteren Referenzen).
+
+    Args:
+        loader: Funktion ohne Argumente, die ein Modell lädt.
+    """
+
+    def __init__(self, loader: Callable[[], Any]):
+        self._loader = loader
+        self._model = loader()
+        self._listeners: list[Callable[[Any], None]] = []
+        self._lock = asyncio.Lock()
+        self.version = 1
+        self.loaded_at = time.time()
+
+    @property
+    def model(self) -> Any:
+        return self._model
+
+    def on_swap(self, callback: Callable[[Any], None]) -> None:
+        """Registriert einen Callback, der nach jedem Tausch das neue Modell bekommt."""
+        self._listeners.append(callback)
+
+    def swap(self, model: Any) -> None:
+        """Setzt ein bereits geladenes Modell atomar als aktuelles Modell."""
+        self._model = model
+        self.version += 1
+        self.loaded_at = time.time()
+        for callback in self._listeners:
+            callback(model)
+
+    async def reload(self) -> Any:
+        """Lädt das Modell neu (Thread) und tauscht es danach aus."""
+        async with self._lock:
+            model = await asyncio.to_thread(self._loader)
+            self.swap(model)
+            return model
@@ -0,0 +1,107 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+# Obergrenze für einen Schlafzyklus – schützt vor Sprüngen der Wanduhr
+MAX_SLEEP_SECONDS = 300.0
+
+
+class ReminderScheduler:
+    """Min-Heap-Scheduler für Reminder.
+
+    Schläft exakt bis zum nächsten fälligen Reminder, wird durch ``push``
+    früher geweckt, wenn ein früherer Reminder dazukommt, und liefert alle
+    fälligen Reminder in einem Durchgang an ``callback``.
+
+    Args:
+        callback: Async-Funktion, die eine Liste fälliger Reminder erhält.
+        clock: Zeitquelle (Unix-Timestamp), für Tests austauschbar.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list[Any]], Awaitable[None]],
+        *,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._callback = callback
+        self._clock = clock
+        self._heap: list[tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def push(self, reminder: Any) -> None:
+        """Plant einen Reminder ein (``reminder.time`` = Unix-Timestamp)."""
+        entry = (float(reminder.time), next(self._counter), reminder)
+        heapq.heappush(self._heap, entry)
+        # Nur wecken, wenn der neue Reminder jetzt an der Spitze steht
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+    def load(self, reminders: Iterable[Any]) -> None:
+        """
+        Übernimmt Reminder in den Heap (z. B. beim Start aus der DB). Bereits
+        eingeplante bleiben erhalten – etwa ein ``push`` während der
+        DB-Abfrage; Duplikate werden über ``_id`` erkannt.
+        """
+        known = {getattr(r, "_id", None) for _, _, r in self._heap}
+        known.discard(None)
+        for r in reminders:
+            r_id = getattr(r, "_id", None)
+            if r_id is not None and r_id in known:
+                continue
+            known.add(r_id)
+            self._heap.append((float(r.time), next(self._counter), r))
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+
+    def next_time(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> list[Any]:
+        """Entnimmt alle Reminder mit ``time <= now`` in zeitlicher Reihenfolge."""
+        now = self._clock() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    async def run(self) -> None:
+        """Hauptschleife: schlafen bis fällig (oder geweckt), dann ausliefern."""
+        while True:
+            self._wakeup.clear()
+            due = self.pop_due()
+            if due:
+                await self._callback(due)
+                continue
+
+            timeout = None
+            next_time = self.next_time()
+            if next_time is not None:
+                timeout = min(max(0.0, next_time - self._clock()),
+                              MAX_SLEEP_SECONDS)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> asyncio.Task:
+        """Startet ``run`` als Task (idempotent)."""
+        if not self.running:
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from utils.logging_helper import log_event
+from utils.model_registry import ModelRegistry
+
+logger = logging.getLogger("ZicklaaBotRewrite.Sentences")
+
+# Budget pro Anfrage: max. Versuche (je ein make_sentence mit 10 tries) & Zeit
+DEFAULT_ATTEMPTS = 50
+DEFAULT_TIMEOUT_SECONDS = 2.0
+FALLBACK_SENTENCE = "Mir fällt grad nix ein 🤷"
+
+# Vorgenerierte Sätze pro overlap-ratio
+POOL_SIZE = 20
+POOL_LOW_WATER = 10
+REFILL_IDLE_DELAY = 0.5  # Refill pausiert, solange Anfragen generieren
+
+
+class SentenceService:
+    """Erzeugt Markov-Sätze im Worker-Thread statt auf dem Event-Loop.
+
+    Jede Anfrage hat ein Budget aus Versuchen und Zeit. Ist es aufgebraucht,
+    kommt ``fallback`` zurück statt endlos weiterzuprobieren.
+
+    Optional hält der Service pro ``max_overlap_ratio`` einen Ringpuffer
+    vorgenerierter Sätze, der im Hintergrund (nur wenn gerade keine Anfrage
+    generiert) aufgefüllt wird. Pools entstehen beim ersten Aufruf mit einer
+    Ratio; Treffer werden in O(1) bedient.
+
+    Das Modell wird bei jeder Generierung frisch aus der Registry gelesen;
+    nach einem Modellwechsel werden die Pools verworfen.
+
+    Args:
+        models: ``ModelRegistry`` mit dem aktuellen markovify-Modell.
+        workers: Anzahl Generator-Threads.
+        pool_enabled: Satz-Pool an/aus.
+        pool_size: Kapazität pro Ratio.
+    """
+
+    def __init__(
+        self,
+        models: ModelRegistry,
+        *,
+        workers: int = 2,
+        pool_enabled: bool = True,
+        pool_size: int = POOL_SIZE,
+    ):
+        self.models = models
+        models.on_swap(lambda _model: self.clear_pools())
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sentences")
+
+        self.pool_enabled = pool_enabled
+        self.pool_size = pool_size
+        self._pools: dict[float, deque[str]] = {}
+        self._refill_needed = asyncio.Event()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._busy = 0
+
+        # Metriken
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.refill_seconds = 0.0
+
+    # -------------------- Generierung --------------------
+
+    @staticmethod
+    def _generate(model: Any, max_overlap_ratio: float, attempts: int, deadline: float) -> Optional[str]:
+        for _ in range(attempts):
+            sentence = model.make_sentence(max_overlap_ratio=max_overlap_ratio)
+            if sentence:
+                return sentence
+            if time.monotonic() >= deadline:
+                break
+        return None
+
+    async def _generate_async(self, max_overlap_ratio: float, attempts: int, timeout: float) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        future = loop.run_in_executor(
+            self._executor, self._generate, self.models.model, max_overlap_ratio, attempts, deadline
+        )
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def make_sentence(
+        self,
+        max_overlap_ratio: float,
+        *,
+        attempts: int = DEFAULT_ATTEMPTS,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        fallback: Optional[str] = FALLBACK_SENTENCE,
+    ) -> Optional[str]:
+        """Liefert einen Satz (aus dem Pool oder frisch) oder ``fallback``."""
+        pool = self._pool_for(max_overlap_ratio)
+        if pool is not None:
+            if pool:
+                self.hits += 1
+                sentence = pool.popleft()
+                if len(pool) < POOL_LOW_WATER:
+                    self._refill_needed.set()
+                return sentence
+            self.misses += 1
+            # leerer Pool (z. B. Refill ist am Budget gescheitert) → erneut anstoßen
+            self._refill_needed.set()
+
+        self._busy += 1
+        try:
+            sentence = await self._generate_async(max_overlap_ratio, attempts, timeout)
+        finally:
+            self._busy -= 1
+        return sentence or fallback
+
+    # -------------------- Pool --------------------
+
+    def _pool_for(self, max_overlap_ratio: float) -> Optional[deque[str]]:
+        if not self.pool_enabled:
+            return None
+        pool = self._pools.get(max_overlap_ratio)
+        if pool is None:
+            pool = self._pools[max_overlap_ratio] = deque(maxlen=self.pool_size)
+            self._refill_needed.set()
+        return pool
+
+    def clear_pools(self) -> None:
+        """Verwirft alle vorgenerierten Sätze (z. B. nach Modellwechsel)."""
+        for pool in self._pools.values():
+            pool.clear()
+        self._refill_needed.set()
+
+    async def _refill_loop(self) -> None:
+        while True:
+            await self._refill_needed.wait()
+            self._refill_needed.clear()
+            for ratio, pool in list(self._pools.items()):
+                while len(pool) < self.pool_size:
+                    while self._busy:
+                        await asyncio.sleep(REFILL_IDLE_DELAY)
+                    started = time.monotonic()
+                    sentence = await self._generate_async(
+                        ratio, DEFAULT_ATTEMPTS, DEFAULT_TIMEOUT_SECONDS)
+                    self.refills += 1
+                    self.refill_seconds += time.monotonic() - started
+                    if not sentence:
+                        break
+                    pool.append(sentence)
+            log_event(
+                logger,
+                logging.DEBUG,
+                self.__class__.__name__,
+                "pool_refilled",
+                **self.stats(),
+            )
+
+    def stats(self) -> dict[str, Any]:
+        """Trefferquote, mittlere Refill-Latenz und Füllstand der Pools."""
+        served = self.hits + self.misses
+        return {
+            "hit_rate": round(self.hits / served, 3) if served else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "refill_avg_ms": round(1000 * self.refill_seconds / self.refills, 1) if self.refills else None,
+            "pools": {ratio: len(pool) for ratio, pool in self._pools.items()},
+        }
+
+    def start(self) -> None:
+        """Startet den Refill-Task (nur bei aktivem Pool)."""
+        if self.pool_enabled and self._refill_task is None:
+            self._refill_task = asyncio.create_task(self._refill_loop())
+
+    def close(self) -> None:
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,96 @@
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+
+class Storage:
+    """Asynchrone, nicht-blockierende Fassade über die SQLite-Datenbank.
+
+    Alle Zugriffe laufen in genau einem Worker-Thread, der die Verbindung
+    besitzt. Dadurch sind Schreibzugriffe serialisiert und der Event-Loop
+    wartet nie auf ``execute``/``commit``. Die Verbindung läuft im WAL-Modus
+    (Leser blockieren Schreiber nicht) und nutzt den Statement-Cache von
+    ``sqlite3`` – parametrisierte Queries werden also nur einmal vorbereitet.
+
+    Args:
+        path: Pfad zur SQLite-Datei.
+        cached_statements: Größe des Prepared-Statement-Caches.
+    """
+
+    def __init__(self, path: str, *, cached_statements: int = 256):
+        self.path = path
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="storage")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor.submit(self._connect, cached_statements).result()
+
+    # -------------------- Worker-Thread --------------------
+
+    def _connect(self, cached_statements: int) -> None:
+        conn = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            cached_statements=cached_statements,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        self._conn = conn
+
+    def _execute(self, sql: str, params: Sequence[Any]) -> sqlite3.Cursor:
+        with self._conn:
+            return self._conn.execute(sql, params)
+
+    def _executemany(self, sql: str, seq: Iterable[Sequence[Any]]) -> int:
+        with self._conn:
+            return self._conn.executemany(sql, seq).rowcount
+
+    def _fetchone(self, sql: str, params: Sequence[Any]) -> Optional[tuple]:
+        return self._conn.execute(sql, params).fetchone()
+
+    def _fetchall(self, sql: str, params: Sequence[Any]) -> list[tuple]:
+        return self._conn.execute(sql, params).fetchall()
+
+    def _run(self, fn: Callable[..., Any], args: tuple) -> Any:
+        with self._conn:
+            return fn(self._conn, *args)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    # -------------------- Öffentliche API --------------------
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Führt ein Statement in eigener Transaktion aus, gibt ``rowcount`` zurück."""
+        cursor = await self._submit(self._execute, sql, params)
+        return cursor.rowcount
+
+    async def insert(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Wie ``execute``, gibt aber die ``lastrowid`` des INSERTs zurück."""
+        cursor = await self._submit(self._execute, sql, params)
+        return cursor.lastrowid
+
+    async def executemany(self, sql: str, seq: Iterable[Sequence[Any]]) -> int:
+        """Führt ein Statement für viele Parameter in EINER Transaktion aus."""
+        return await self._submit(self._executemany, sql, list(seq))
+
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        return await self._submit(self._fetchone, sql, params)
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> list[tuple]:
+        return await self._submit(self._fetchall, sql, params)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Führt ``fn(conn, *args)`` im Worker-Thread in einer Transaktion aus."""
+        return await self._submit(self._run, fn, args)
+
+    async def close(self) -> None:
+        await self._submit(self._close)
+        self._executor.shutdown(wait=True)